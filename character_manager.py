@@ -9,7 +9,21 @@ AI Usage: ChatGPT was used to fix any and all indentation errors, as well as pro
 This module handles character creation, loading, and saving.
 """
 
+import json
+import math
 import os
+import shutil
+import sqlite3
+import stat
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+import game_data
+from inventory_system import Inventory, StatEngine, DERIVED_STATS
 from custom_exceptions import (
     InvalidCharacterClassError,
     CharacterNotFoundError,
@@ -18,20 +32,72 @@ from custom_exceptions import (
     CharacterDeadError
 )
 
+# ============================================================================
+# CHARACTER STATE CONTAINERS
+# ============================================================================
+
+class OrderedIdSet:
+    """
+    Insertion-ordered set of IDs with the list methods the game uses
+
+    Used for a character's active_quests and completed_quests: `in`,
+    append and remove are O(1) instead of O(n), while iteration (and
+    therefore display and save_character output) keeps the order IDs were
+    added. Appending an ID that is already present does nothing.
+    """
+
+    def __init__(self, ids=()):
+        self._ids = dict.fromkeys(ids)
+
+    def __contains__(self, item_id):
+        return item_id in self._ids
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __eq__(self, other):
+        if isinstance(other, (OrderedIdSet, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"OrderedIdSet({list(self._ids)!r})"
+
+    def append(self, item_id):
+        self._ids[item_id] = None
+
+    add = append
+
+    def remove(self, item_id):
+        """Remove an ID, raising ValueError if missing (like list.remove)"""
+        try:
+            del self._ids[item_id]
+        except KeyError:
+            raise ValueError(f"{item_id!r} not in OrderedIdSet")
+
+    def discard(self, item_id):
+        self._ids.pop(item_id, None)
+
+    def copy(self):
+        return OrderedIdSet(self._ids)
+
+    def clear(self):
+        self._ids.clear()
+
 # ============================================================================
 # CHARACTER MANAGEMENT FUNCTIONS
 # ============================================================================
 
 def create_character(name, character_class):
-    valid_classes = {
-        "Warrior": {"health": 120, "strength": 15, "magic": 5},
-        "Mage": {"health": 80, "strength": 8, "magic": 20},
-        "Rogue": {"health": 90, "strength": 12, "magic": 10},
-        "Cleric": {"health": 100, "strength": 10, "magic": 15}
-    }
-    if character_class not in valid_classes:
+    # Class stats come from data/classes.txt (see game_data.get_class_table)
+    base = game_data.get_class_table().get(character_class)
+    if base is None:
         raise InvalidCharacterClassError("Invalid class")
-    base = valid_classes[character_class]
     return {
         "name": name,
         "class": character_class,
@@ -42,9 +108,9 @@ def create_character(name, character_class):
         "magic": base["magic"],
         "experience": 0,
         "gold": 100,
-        "inventory": [],
-        "active_quests": [],
-        "completed_quests": []
+        "inventory": Inventory(),
+        "active_quests": OrderedIdSet(),
+        "completed_quests": OrderedIdSet()
     }
 
     # TODO: Implement character creation
@@ -61,18 +127,46 @@ def create_character(name, character_class):
     
     # Raise InvalidCharacterClassError if class not in valid list
 
-def save_character(character, save_directory="data/save_games"):
+def save_character(character, save_directory="data/save_games", backups=0, fsync=True, force=False,
+                   save_format=None):
+    """
+    Save a character without ever leaving a truncated save behind
+
+    The save is written to a temporary file in save_directory, flushed and
+    fsynced, then renamed over the old save, so a crash mid-save leaves
+    either the old or the new file. With backups=N the previous N saves
+    are kept as <name>_save.txt.bak1 (newest) to .bakN. fsync=False skips
+    the disk flushes for callers that sync a whole batch themselves.
+
+    If save_directory names a save database (ends in .db, .sqlite or
+    .sqlite3) the character is stored there instead; backups does not
+    apply.
+
+    Nothing is written if the character has not changed since it was last
+    saved to or loaded from save_directory (see mark_dirty); force=True
+    writes anyway.
+
+    save_format is "text" (KEY: value lines) or "binary" (see
+    encode_binary_character); it defaults to DEFAULT_SAVE_FORMAT.
+    load_character reads either.
+    """
+    if not force and not is_dirty(character, save_directory):
+        return True
+
+    data = _encode_character(character, save_format)
+    if _is_save_database(save_directory):
+        _database_save(save_directory, [(character, data)])
+        _mark_saved(character, save_directory)
+        return True
+
     os.makedirs(save_directory, exist_ok=True)
 
     filename = os.path.join(save_directory, f"{character['name']}_save.txt")
 
     try:
-        with open(filename, "w") as f:
-            for key, value in character.items():
-                if isinstance(value, list):
-                    value = ",".join(map(str, value))
-                f.write(f"{key.upper()}: {value}\n")
-
+        _atomic_write(filename, data, backups, fsync)
+        _mark_saved(character, save_directory)
+        _update_save_index(save_directory, [_index_record(character, data)])
         return True
 
     except Exception:
@@ -84,99 +178,1179 @@ def save_character(character, save_directory="data/save_games"):
     # Lists should be saved as comma-separated values
 
 def load_character(character_name, save_directory="data/save_games"):
+    character = _parse_character(_read_save(character_name, save_directory))
+    _mark_saved(character, save_directory)
+    return character
+
+
+    # TODO: Implement load functionality
+    # Check if file exists → CharacterNotFoundError
+    # Try to read file → SaveFileCorruptedError
+    # Validate data format → InvalidSaveDataError
+    # Parse comma-separated lists back into Python lists
+
+def list_saved_characters(save_directory="data/save_games"):
+    if _is_save_database(save_directory):
+        return _database_names(save_directory)
+
+    return list(get_save_summaries(save_directory))
+    
+    # TODO: Implement this function
+    # Return empty list if directory doesn't exist
+    # Extract character names from filenames
+
+def delete_character(character_name, save_directory="data/save_games"):
+    if _is_save_database(save_directory):
+        if not _database_delete(save_directory, character_name):
+            raise CharacterNotFoundError("Character does not exist")
+        return True
+
+    filename = os.path.join(save_directory, f"{character_name}_save.txt")
+
+    if not os.path.exists(filename):
+        raise CharacterNotFoundError("Character does not exist")
+
+    os.remove(filename)
+    _update_save_index(save_directory, [{"name": character_name, "deleted": True}])
+    return True
+    # TODO: Implement character deletion
+    # Verify file exists before attempting deletion
+
+
+# ============================================================================
+# CHANGE TRACKING
+# ============================================================================
+
+def mark_dirty(character):
+    """
+    Record that a character changed and needs saving
+
+    Every function that modifies a character calls this. Code that edits
+    the character dictionary directly must call it too, or the next
+    save_character may skip the change.
+    """
+    character["_version"] = character.get("_version", 0) + 1
+
+def is_dirty(character, save_directory="data/save_games"):
+    """
+    Check whether a character has changes not yet saved to save_directory
+
+    Returns: True unless the character was saved to (or loaded from)
+             save_directory and has not been modified since
+    """
+    saved = character.get("_saved")
+    if saved is None:
+        return True
+    location, version = saved
+    if location != os.path.abspath(save_directory) or version != character.get("_version", 0):
+        return True
+    # The save may have been deleted behind our back
+    if _is_save_database(save_directory):
+        return not _database_has(save_directory, character["name"])
+    return not os.path.exists(os.path.join(save_directory, f"{character['name']}_save.txt"))
+
+def _mark_saved(character, save_directory):
+    character["_saved"] = (os.path.abspath(save_directory), character.get("_version", 0))
+
+# ============================================================================
+# BATCH SAVE AND LOAD
+# ============================================================================
+
+def save_characters(characters, save_directory="data/save_games", workers=None, fsync=True,
+                    save_format=None):
+    """
+    Save many characters at once (for example an autosave of every player)
+
+    Characters unchanged since their last save to save_directory are
+    skipped. The rest are serialized up front. Save files are written
+    atomically like save_character, optionally spread over a thread pool,
+    and the save directory is synced once at the end instead of once per
+    file. A save database gets every character in a single transaction.
+
+    Args:
+        characters: Iterable of character dictionaries
+        workers: Threads writing files in parallel (None or 1 = no pool)
+
+    Returns: Dictionary of character name -> True, or the exception that
+             stopped that character from being saved
+    """
+    results = {}
+    buffers = []
+    for character in characters:
+        name = character.get("name")
+        try:
+            if not name:
+                raise InvalidSaveDataError("Missing field: name")
+            if not is_dirty(character, save_directory):
+                results[name] = True
+                continue
+            buffers.append((character, name, _encode_character(character, save_format)))
+        except Exception as e:
+            results[name] = e
+
+    if _is_save_database(save_directory):
+        try:
+            _database_save(save_directory, [(character, data) for character, name, data in buffers])
+            outcome = True
+        except Exception as e:
+            outcome = e
+        for character, name, data in buffers:
+            results[name] = outcome
+            if outcome is True:
+                _mark_saved(character, save_directory)
+        return results
+
+    os.makedirs(save_directory, exist_ok=True)
+
+    def write(job):
+        character, name, data = job
+        filename = os.path.join(save_directory, f"{name}_save.txt")
+        try:
+            _atomic_write(filename, data, fsync=fsync, sync_directory=False)
+            _mark_saved(character, save_directory)
+            return name, True
+        except Exception as e:
+            return name, e
+
+    if workers is not None and workers > 1 and len(buffers) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(write, buffers))
+    else:
+        outcomes = [write(job) for job in buffers]
+    results.update(outcomes)
+
+    if fsync and buffers:
+        _fsync_directory(save_directory)
+    saved = [
+        _index_record(character, data) for character, name, data in buffers
+        if results[name] is True
+    ]
+    if saved:
+        _update_save_index(save_directory, saved)
+    return results
+
+def load_characters(names, save_directory="data/save_games", workers=None):
+    """
+    Load many characters at once
+
+    A save database is read with one query per 500 names; save files may
+    be read over a thread pool.
+
+    Returns: Dictionary of name -> character dictionary, or the exception
+             load_character would have raised for that name
+    """
+    names = list(names)
+    results = {}
+
+    if _is_save_database(save_directory):
+        found = _database_load_many(save_directory, names)
+        for name in names:
+            if name not in found:
+                results[name] = CharacterNotFoundError("Character not found")
+                continue
+            try:
+                results[name] = _parse_character(found[name])
+                _mark_saved(results[name], save_directory)
+            except Exception as e:
+                results[name] = e
+        return results
+
+    def read(name):
+        try:
+            return name, load_character(name, save_directory)
+        except Exception as e:
+            return name, e
+
+    if workers is not None and workers > 1 and len(names) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results.update(pool.map(read, names))
+    else:
+        results.update(read(name) for name in names)
+    return results
+
+# ============================================================================
+# CHARACTER CACHE
+# ============================================================================
+
+class CharacterCache:
+    """
+    Bounded LRU cache of loaded characters for one save directory
+
+    get() returns the cached character dictionary (the same object every
+    time) or loads it with load_character. When the cache holds more than
+    max_characters, or the estimated size of its characters exceeds
+    max_bytes, the least recently used characters are evicted; a character
+    with unsaved changes (see is_dirty) is saved before it is dropped. If
+    that save fails the character stays cached (and the cache may stay
+    over its limits) until a later eviction or flush() saves it;
+    writeback_errors counts the failures and last_writeback_error holds
+    the most recent one. flush() saves every dirty character without
+    evicting anything.
+
+    hits, misses, evictions and writebacks count cache activity.
+    """
+
+    def __init__(self, save_directory="data/save_games", max_characters=1000, max_bytes=None,
+                 save_format=None):
+        """
+        Args:
+            max_characters: Most characters held at once (None = no limit)
+            max_bytes: Most estimated bytes held at once (None = no limit);
+                       the most recently used character is always kept
+            save_format: Format used when writing characters back
+        """
+        self.save_directory = save_directory
+        self.max_characters = max_characters
+        self.max_bytes = max_bytes
+        self.save_format = save_format
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.writebacks = 0
+        self.writeback_errors = 0
+        self.last_writeback_error = None
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, name):
+        """
+        Return the character called name, loading it on a miss
+
+        Raises: whatever load_character raises for a missing or bad save
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None:
+                self._entries.move_to_end(name)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            character = load_character(name, self.save_directory)
+            self._store(name, character)
+            return character
+
+    def put(self, character):
+        """Cache a character (for example a newly created one)"""
+        with self._lock:
+            self._store(character["name"], character)
+
+    def discard(self, name):
+        """Drop a character without saving it"""
+        with self._lock:
+            entry = self._entries.pop(name, None)
+            if entry is not None:
+                self.total_bytes -= entry[1]
+
+    def flush(self):
+        """
+        Save every cached character with unsaved changes
+
+        Returns: Dictionary of name -> True or exception, as save_characters
+        """
+        with self._lock:
+            dirty = [
+                character for character, size in self._entries.values()
+                if is_dirty(character, self.save_directory)
+            ]
+            results = save_characters(dirty, self.save_directory, save_format=self.save_format)
+            for character in dirty:
+                if results.get(character["name"]) is True:
+                    self.writebacks += 1
+                    self._resize(character["name"])
+            return results
+
+    def stats(self):
+        """Return the cache counters and current size as a dictionary"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "writebacks": self.writebacks,
+                "writeback_errors": self.writeback_errors,
+                "characters": len(self._entries),
+                "bytes": self.total_bytes
+            }
+
+    def _store(self, name, character):
+        old = self._entries.pop(name, None)
+        if old is not None:
+            self.total_bytes -= old[1]
+        size = _estimate_character_size(character)
+        self._entries[name] = (character, size)
+        self.total_bytes += size
+        self._evict()
+
+    def _resize(self, name):
+        character, size = self._entries[name]
+        new_size = _estimate_character_size(character)
+        self._entries[name] = (character, new_size)
+        self.total_bytes += new_size - size
+
+    def _evict(self):
+        """Drop least recently used characters until the cache fits its limits"""
+        count = len(self._entries)
+        total = self.total_bytes
+        if not self._over_limits(count, total):
+            return
+        # The newest entry is always kept; a character whose write-back
+        # fails is kept too, so no changes are lost
+        newest = next(reversed(self._entries))
+        evicted = []
+        for name, (character, size) in self._entries.items():
+            if name == newest or not self._over_limits(count, total):
+                break
+            if is_dirty(character, self.save_directory):
+                try:
+                    save_character(character, self.save_directory, save_format=self.save_format)
+                except Exception as e:
+                    self.writeback_errors += 1
+                    self.last_writeback_error = e
+                    continue
+                self.writebacks += 1
+            evicted.append(name)
+            count -= 1
+            total -= size
+        for name in evicted:
+            del self._entries[name]
+        self.total_bytes = total
+        self.evictions += len(evicted)
+
+    def _over_limits(self, count, total):
+        return ((self.max_characters is not None and count > self.max_characters)
+                or (self.max_bytes is not None and total > self.max_bytes))
+
+def _estimate_character_size(character):
+    """Rough size of a character in bytes (about its text save size)"""
+    size = 0
+    for key, value in character.items():
+        if key.startswith("_"):
+            continue
+        size += len(key) + 16
+        if isinstance(value, (list, OrderedIdSet, Inventory)):
+            size += sum(len(str(item)) + 8 for item in value)
+        else:
+            size += len(str(value))
+    return size
+
+# ============================================================================
+# SAVE FILE HELPERS
+# ============================================================================
+
+def _read_save(character_name, save_directory):
+    """
+    Return the stored save bytes for character_name
+
+    Raises:
+        CharacterNotFoundError if there is no save
+        SaveFileCorruptedError if the file cannot be read
+    """
+    if _is_save_database(save_directory):
+        data = _database_load(save_directory, character_name)
+        if data is None:
+            raise CharacterNotFoundError("Character not found")
+        return data
+
     filename = os.path.join(save_directory, f"{character_name}_save.txt")
 
     if not os.path.exists(filename):
         raise CharacterNotFoundError("Character not found")
 
     try:
-        with open(filename, "r") as f:
-            lines = f.readlines()
+        with open(filename, "rb") as f:
+            return f.read()
     except Exception:
         raise SaveFileCorruptedError("Cannot read save file")
 
-    character = {}
-    required_fields = [
-        "NAME", "CLASS", "LEVEL", "HEALTH", "MAX_HEALTH",
-        "STRENGTH", "MAGIC", "EXPERIENCE", "GOLD",
-        "INVENTORY", "ACTIVE_QUESTS", "COMPLETED_QUESTS"
-    ]
+def _serialize_character(character):
+    """Render a character in the KEY: value save format"""
+    lines = []
+    for key, value in character.items():
+        # Underscore keys hold runtime state (trackers, caches)
+        if key.startswith("_"):
+            continue
+        if isinstance(value, (list, OrderedIdSet, Inventory)):
+            value = ",".join(map(str, value))
+        elif key == "stat_modifiers":
+            value = _format_stat_modifiers(value)
+        lines.append(f"{key.upper()}: {value}\n")
+    return "".join(lines)
+
+def _encode_character(character, save_format=None):
+    """Render a character as save bytes in the requested format"""
+    if save_format is None:
+        save_format = DEFAULT_SAVE_FORMAT
+    if save_format == "binary":
+        return encode_binary_character(character)
+    if save_format == "text":
+        return _serialize_character(character).encode("utf-8")
+    raise ValueError(f"Unknown save format: {save_format}")
+
+def _parse_character(data):
+    """
+    Build a character from the bytes of a save (text or binary)
+
+    Raises:
+        SaveFileCorruptedError if the bytes are not text
+        InvalidSaveDataError if fields are missing or have the wrong type
+    """
+    if data.startswith(BINARY_SAVE_MAGIC):
+        return decode_binary_character(data)
+
+    character = _split_text_save(data)
+    for field in _REQUIRED_FIELDS:
+        if field not in character:
+            raise InvalidSaveDataError("Missing required field")
+
+    for field in character:
+        character[field] = _convert_text_field(field, character[field])
+
+    return character
+
+def _split_text_save(data):
+    """Split KEY: value save text into raw strings without converting them"""
+    try:
+        lines = data.decode("utf-8").splitlines()
+    except UnicodeDecodeError:
+        raise SaveFileCorruptedError("Cannot read save file")
 
+    fields = {}
     for line in lines:
         if ":" not in line:
             raise InvalidSaveDataError("Invalid save format")
         key, value = line.strip().split(":", 1)
-        value = value.strip()
-        character[key.lower()] = value
-
-    for field in required_fields:
-        if field.lower() not in character:
-            raise InvalidSaveDataError("Missing required field")
+        fields[key.lower()] = value.strip()
+    return fields
 
+def _convert_text_field(field, value):
+    """Convert one raw text-save value to the type the character uses"""
     try:
-        character["level"] = int(character["level"])
-        character["health"] = int(character["health"])
-        character["max_health"] = int(character["max_health"])
-        character["strength"] = int(character["strength"])
-        character["magic"] = int(character["magic"])
-        character["experience"] = int(character["experience"])
-        character["gold"] = int(character["gold"])
-        character["inventory"] = character["inventory"].split(",") if character["inventory"] else []
-        character["active_quests"] = character["active_quests"].split(",") if character["active_quests"] else []
-        character["completed_quests"] = character["completed_quests"].split(",") if character["completed_quests"] else []
+        if field in _STAT_FIELDS:
+            return int(value)
+        if field == "inventory":
+            return Inventory(value.split(",") if value else [])
+        if field in _LIST_FIELDS:
+            return OrderedIdSet(value.split(",") if value else [])
+        if field == "stat_modifiers":
+            return _parse_stat_modifiers(value)
     except Exception:
         raise InvalidSaveDataError("Incorrect data types")
+    if field in ("equipped_weapon", "equipped_armor") and value in ("", "None"):
+        return None
+    return value
+
+def _format_stat_modifiers(stat_modifiers):
+    """{"weapon": (("strength", 5),)} -> "weapon:strength:5" (comma-separated)"""
+    return ",".join(
+        f"{slot}:{stat}:{value}"
+        for slot, modifiers in stat_modifiers.items()
+        for stat, value in modifiers
+    )
+
+def _parse_stat_modifiers(value):
+    """Inverse of _format_stat_modifiers"""
+    stat_modifiers = {}
+    for entry in value.split(","):
+        if not entry:
+            continue
+        # Sources may contain colons ("buff:bless"); stats and values do not
+        slot, stat, delta = entry.rsplit(":", 2)
+        stat_modifiers[slot] = stat_modifiers.get(slot, ()) + ((stat, int(delta)),)
+    return stat_modifiers
+
+def _atomic_write(filename, data, backups=0, fsync=True, sync_directory=True):
+    """
+    Replace filename with data via a synced temporary file and a rename
+
+    sync_directory=False leaves syncing the directory entry to the caller
+    (save_characters does it once for the whole batch).
+    """
+    directory = os.path.dirname(filename) or "."
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(filename)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        # mkstemp creates 0600 files; give the save the mode open() would
+        os.chmod(temp_path, _save_file_mode(filename))
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        if backups > 0:
+            _rotate_backups(filename, backups)
+        os.replace(temp_path, filename)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+    if fsync and sync_directory:
+        _fsync_directory(directory)
+
+# The umask can only be read by setting it, so read it once at import,
+# before any save threads exist
+_umask = os.umask(0o022)
+os.umask(_umask)
+
+def _save_file_mode(filename):
+    """Mode for a rewritten file: the existing file's, else 0666 minus umask"""
+    try:
+        return stat.S_IMODE(os.stat(filename).st_mode)
+    except OSError:
+        return 0o666 & ~_umask
+
+def _rotate_backups(filename, backups):
+    """Shift filename.bak1..bakN down one slot and keep filename as .bak1"""
+    if not os.path.exists(filename):
+        return
+    for number in range(backups - 1, 0, -1):
+        older = f"{filename}.bak{number}"
+        if os.path.exists(older):
+            os.replace(older, f"{filename}.bak{number + 1}")
+    newest = f"{filename}.bak1"
+    if os.path.exists(newest):
+        os.remove(newest)
+    try:
+        # A hard link keeps the old contents once the new save is renamed in
+        os.link(filename, newest)
+    except OSError:
+        shutil.copy2(filename, newest)
+
+def _fsync_directory(directory):
+    """Make a rename in directory durable (not supported on every OS)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+# ============================================================================
+# BINARY SAVE FORMAT
+# ============================================================================
+
+# Format used when save_character is not given one
+DEFAULT_SAVE_FORMAT = "text"
+
+# Layout (little-endian):
+#   header   magic b"QCSV", u16 format version
+#   stats    level, health, max_health, strength, magic, experience, gold
+#            as seven signed 32-bit ints
+#   strings  name, class
+#   lists    inventory, active_quests, completed_quests: u16 count, then
+#            that many strings
+#   extras   u16 count, then (key string, tagged value) for every other
+#            saved key; the tag byte is 0 = None, 1 = string, 2 = int
+#            (signed 64-bit)
+# Every string is a u16 byte length followed by UTF-8, so IDs may contain
+# commas or colons.
+BINARY_SAVE_MAGIC = b"QCSV"
+BINARY_SAVE_VERSION = 1
+_BINARY_HEADER = struct.Struct("<4sH")
+_BINARY_STATS = struct.Struct("<7i")
+_BINARY_COUNT = struct.Struct("<H")
+_BINARY_INT = struct.Struct("<q")
+_STAT_FIELDS = ("level", "health", "max_health", "strength", "magic", "experience", "gold")
+_LIST_FIELDS = ("inventory", "active_quests", "completed_quests")
+_REQUIRED_FIELDS = ("name", "class") + _STAT_FIELDS + _LIST_FIELDS
+_CORE_FIELDS = frozenset(_REQUIRED_FIELDS)
+
+def encode_binary_character(character):
+    """
+    Render a character in the binary save format
+
+    Raises: InvalidSaveDataError if a stat is not a 32-bit integer, a list
+            or string is too long, or a required field is missing
+    """
+    parts = [_BINARY_HEADER.pack(BINARY_SAVE_MAGIC, BINARY_SAVE_VERSION)]
+
+    def add_string(value):
+        encoded = str(value).encode("utf-8")
+        parts.append(_BINARY_COUNT.pack(len(encoded)))
+        parts.append(encoded)
+
+    extras = [
+        (key, value) for key, value in character.items()
+        if key not in _CORE_FIELDS and not key.startswith("_")
+    ]
+    try:
+        parts.append(_BINARY_STATS.pack(*[character[field] for field in _STAT_FIELDS]))
+        add_string(character["name"])
+        add_string(character["class"])
+        for field in _LIST_FIELDS:
+            values = list(character[field])
+            parts.append(_BINARY_COUNT.pack(len(values)))
+            for value in values:
+                add_string(value)
+
+        parts.append(_BINARY_COUNT.pack(len(extras)))
+        for key, value in extras:
+            add_string(key)
+            if key == "stat_modifiers":
+                value = _format_stat_modifiers(value)
+            if value is None:
+                parts.append(b"\x00")
+            elif isinstance(value, int) and not isinstance(value, bool) and -2**63 <= value < 2**63:
+                parts.append(b"\x02" + _BINARY_INT.pack(value))
+            else:
+                parts.append(b"\x01")
+                add_string(value)
+    except KeyError as e:
+        raise InvalidSaveDataError(f"Missing field: {e.args[0]}")
+    except struct.error:
+        raise InvalidSaveDataError("Value out of range for the binary save format")
+
+    return b"".join(parts)
+
+def decode_binary_character(data):
+    """
+    Build a character from the binary save format
+
+    Raises: InvalidSaveDataError if the data is truncated, has an unknown
+            version or is otherwise malformed
+    """
+    try:
+        magic, version = _BINARY_HEADER.unpack_from(data, 0)
+        if magic != BINARY_SAVE_MAGIC or version != BINARY_SAVE_VERSION:
+            raise InvalidSaveDataError(f"Unsupported binary save version: {version}")
+        offset = _BINARY_HEADER.size
+
+        character = {}
+        stats = _BINARY_STATS.unpack_from(data, offset)
+        offset += _BINARY_STATS.size
+
+        def read_string(offset):
+            (length,) = _BINARY_COUNT.unpack_from(data, offset)
+            offset += _BINARY_COUNT.size
+            end = offset + length
+            if end > len(data):
+                raise InvalidSaveDataError("Truncated binary save")
+            return bytes(data[offset:end]).decode("utf-8"), end
+
+        character["name"], offset = read_string(offset)
+        character["class"], offset = read_string(offset)
+        character.update(zip(_STAT_FIELDS, stats))
+
+        lists = []
+        for field in _LIST_FIELDS:
+            (count,) = _BINARY_COUNT.unpack_from(data, offset)
+            offset += _BINARY_COUNT.size
+            values = []
+            for _ in range(count):
+                value, offset = read_string(offset)
+                values.append(value)
+            lists.append(values)
+        character["inventory"] = Inventory(lists[0])
+        character["active_quests"] = OrderedIdSet(lists[1])
+        character["completed_quests"] = OrderedIdSet(lists[2])
+
+        (count,) = _BINARY_COUNT.unpack_from(data, offset)
+        offset += _BINARY_COUNT.size
+        for _ in range(count):
+            key, offset = read_string(offset)
+            tag = data[offset]
+            offset += 1
+            if tag == 0:
+                character[key] = None
+            elif tag == 2:
+                (character[key],) = _BINARY_INT.unpack_from(data, offset)
+                offset += _BINARY_INT.size
+            elif tag == 1:
+                character[key], offset = read_string(offset)
+                if key == "stat_modifiers":
+                    character[key] = _parse_stat_modifiers(character[key])
+            else:
+                raise InvalidSaveDataError("Invalid value tag in binary save")
+    except (struct.error, IndexError, UnicodeDecodeError, ValueError):
+        raise InvalidSaveDataError("Corrupted binary save")
 
     return character
 
+def migrate_saves(save_directory="data/save_games", save_format="binary"):
+    """
+    Rewrite every save in save_directory (or save database) in save_format
 
-    # TODO: Implement load functionality
-    # Check if file exists → CharacterNotFoundError
-    # Try to read file → SaveFileCorruptedError
-    # Validate data format → InvalidSaveDataError
-    # Parse comma-separated lists back into Python lists
+    Saves are loaded with auto-detection and rewritten atomically, so the
+    tool can be re-run or interrupted safely.
 
-def list_saved_characters(save_directory="data/save_games"):
+    Save directories are scanned directly rather than through the save
+    index, so hand-copied saves are converted too.
+
+    Returns: Dictionary of character name -> True, or the exception that
+             stopped that save from being converted
+    """
+    if _is_save_database(save_directory):
+        names = _database_names(save_directory)
+    else:
+        names = _scan_save_names(save_directory)
+    loaded = load_characters(names, save_directory)
+    results = {}
+    for name, character in loaded.items():
+        if isinstance(character, Exception):
+            results[name] = character
+            continue
+        try:
+            results[name] = save_character(character, save_directory, force=True,
+                                           save_format=save_format)
+        except Exception as e:
+            results[name] = e
+    return results
+
+# ============================================================================
+# LAZY CHARACTER VIEWS
+# ============================================================================
+
+class CharacterView(Mapping):
+    """
+    Read-only character over the bytes of a save, decoded field by field
+
+    Nothing is converted until a field is read, and each field is converted
+    once. For binary saves the stats, name and class are unpacked in place;
+    the list fields are only walked if one of them is read. For text saves
+    the lines are split on first access, but the comma-separated lists are
+    only split into IDs for the fields that are read.
+
+    Raises on field access:
+        InvalidSaveDataError if the field is missing or malformed
+        SaveFileCorruptedError if a text save is not valid UTF-8
+    """
+
+    def __init__(self, data):
+        self._data = data
+        self._binary = data.startswith(BINARY_SAVE_MAGIC)
+        self._raw = None
+        self._fields = {}
+
+    def __getitem__(self, key):
+        if key in self._fields:
+            return self._fields[key]
+        if self._binary:
+            value = self._binary_field(key)
+        else:
+            raw = self._text_fields()
+            if key not in raw:
+                if key in _CORE_FIELDS:
+                    raise InvalidSaveDataError("Missing required field")
+                raise KeyError(key)
+            value = _convert_text_field(key, raw[key])
+        self._fields[key] = value
+        return value
+
+    def __iter__(self):
+        if self._binary:
+            return iter(self._decoded())
+        return iter(self._text_fields())
+
+    def __len__(self):
+        if self._binary:
+            return len(self._decoded())
+        return len(self._text_fields())
+
+    def to_character(self):
+        """Return a full character dictionary, as load_character would"""
+        return _parse_character(self._data)
+
+    def _text_fields(self):
+        if self._raw is None:
+            self._raw = _split_text_save(self._data)
+        return self._raw
+
+    def _decoded(self):
+        if self._raw is None:
+            self._raw = decode_binary_character(self._data)
+        return self._raw
+
+    def _binary_field(self, key):
+        if self._raw is not None or key not in ("name", "class") + _STAT_FIELDS:
+            decoded = self._decoded()
+            if key not in decoded:
+                raise KeyError(key)
+            return decoded[key]
+        try:
+            magic, version = _BINARY_HEADER.unpack_from(self._data, 0)
+            if version != BINARY_SAVE_VERSION:
+                raise InvalidSaveDataError(f"Unsupported binary save version: {version}")
+            offset = _BINARY_HEADER.size
+            if key in _STAT_FIELDS:
+                stats = _BINARY_STATS.unpack_from(self._data, offset)
+                return stats[_STAT_FIELDS.index(key)]
+            offset += _BINARY_STATS.size
+            for field in ("name", "class"):
+                (length,) = _BINARY_COUNT.unpack_from(self._data, offset)
+                offset += _BINARY_COUNT.size
+                if field == key:
+                    if offset + length > len(self._data):
+                        raise InvalidSaveDataError("Truncated binary save")
+                    return bytes(self._data[offset:offset + length]).decode("utf-8")
+                offset += length
+        except (struct.error, UnicodeDecodeError):
+            raise InvalidSaveDataError("Corrupted binary save")
+
+def load_character_view(character_name, save_directory="data/save_games"):
+    """
+    Open a save as a CharacterView without parsing its fields
+
+    Raises:
+        CharacterNotFoundError if there is no save
+        SaveFileCorruptedError if the file cannot be read
+    """
+    return CharacterView(_read_save(character_name, save_directory))
+
+def iter_character_views(save_directory="data/save_games"):
+    """
+    Yield a CharacterView for every save in save_directory (or database)
+
+    Intended for scans such as leaderboards that read a few fields from
+    many saves. Saves that disappear mid-scan are skipped.
+    """
+    names = list_saved_characters(save_directory)
+    if _is_save_database(save_directory):
+        for start in range(0, len(names), 500):
+            found = _database_load_many(save_directory, names[start:start + 500])
+            for name in names[start:start + 500]:
+                if name in found:
+                    yield CharacterView(found[name])
+        return
+
+    for name in names:
+        try:
+            yield load_character_view(name, save_directory)
+        except CharacterNotFoundError:
+            continue
+
+# ============================================================================
+# SAVE INDEX
+# ============================================================================
+
+# Journal kept in each save directory so the saves can be listed and
+# summarized without opening them. One JSON object per line, either
+# {"name", "class", "level", "gold", "saved_at", "size"} for a save or
+# {"name", "deleted": true} for a deletion; later lines win. The journal
+# is compacted once it holds many superseded lines.
+SAVE_INDEX_FILENAME = ".save_index"
+
+_save_index_lock = threading.RLock()
+
+# Index path -> size in bytes when it was last compacted or replayed; an
+# append only triggers another replay once the journal has doubled since
+_save_index_sizes = {}
+
+def get_save_summaries(save_directory="data/save_games"):
+    """
+    Return name -> summary for every save without opening the saves
+
+    A summary is {"class", "level", "gold", "saved_at", "size"}; class,
+    level and gold are None for a save that could not be read when the
+    index was rebuilt. Names are in sorted order.
+
+    A save directory answers from its index file, which is rebuilt if it is
+    missing or damaged; a save database answers from its table.
+    """
+    if _is_save_database(save_directory):
+        return _database_summaries(save_directory)
     if not os.path.exists(save_directory):
-        return []
+        return {}
+
+    entries = _read_save_index(save_directory)
+    if entries is None:
+        return rebuild_save_index(save_directory)
+    return {name: entries[name] for name in sorted(entries)}
+
+def rebuild_save_index(save_directory="data/save_games"):
+    """
+    Rebuild the save index of save_directory from the save files
+
+    Use after saves were copied in or removed by hand. Every save is
+    opened, but only its class, level and gold are decoded.
 
+    Returns: Dictionary of name -> summary, as get_save_summaries
+    """
+    if _is_save_database(save_directory):
+        return _database_summaries(save_directory)
+
+    entries = {}
+    for name in sorted(_scan_save_names(save_directory)):
+        try:
+            stat = os.stat(os.path.join(save_directory, f"{name}_save.txt"))
+        except OSError:
+            continue
+        summary = {"class": None, "level": None, "gold": None,
+                   "saved_at": stat.st_mtime, "size": stat.st_size}
+        try:
+            view = load_character_view(name, save_directory)
+            summary.update({"class": view["class"], "level": view["level"], "gold": view["gold"]})
+        except (CharacterNotFoundError, SaveFileCorruptedError, InvalidSaveDataError):
+            pass
+        entries[name] = summary
+
+    if os.path.isdir(save_directory):
+        with _save_index_lock:
+            _write_save_index(save_directory, entries)
+    return entries
+
+def _scan_save_names(save_directory):
+    """List character names from the save file names in save_directory"""
+    if not os.path.exists(save_directory):
+        return []
     files = os.listdir(save_directory)
     return [f.replace("_save.txt", "") for f in files if f.endswith("_save.txt")]
-    
-    # TODO: Implement this function
-    # Return empty list if directory doesn't exist
-    # Extract character names from filenames
 
-def delete_character(character_name, save_directory="data/save_games"):
-    filename = os.path.join(save_directory, f"{character_name}_save.txt")
+def _index_record(character, data):
+    return {
+        "name": character["name"],
+        "class": character["class"],
+        "level": character["level"],
+        "gold": character["gold"],
+        "saved_at": time.time(),
+        "size": len(data)
+    }
 
-    if not os.path.exists(filename):
-        raise CharacterNotFoundError("Character does not exist")
+def _read_save_index(save_directory):
+    """Replay the index journal, or return None if it is missing or damaged"""
+    index_path = os.path.join(save_directory, SAVE_INDEX_FILENAME)
+    # Compaction rewrites what was read, so an append must not land between
+    with _save_index_lock:
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+                size = os.fstat(f.fileno()).st_size
+        except (OSError, UnicodeDecodeError):
+            return None
 
-    os.remove(filename)
-    return True
-    # TODO: Implement character deletion
-    # Verify file exists before attempting deletion
+        entries = {}
+        try:
+            for line in lines:
+                record = json.loads(line)
+                name = record.pop("name")
+                if record.get("deleted"):
+                    entries.pop(name, None)
+                else:
+                    entries[name] = record
+        except (ValueError, KeyError, AttributeError):
+            return None
+
+        if len(lines) > 2 * len(entries) + 64:
+            _write_save_index(save_directory, entries)
+        else:
+            # Nothing to compact yet; wait for the journal to double again
+            _save_index_sizes[os.path.abspath(index_path)] = size
+    return entries
 
+def _write_save_index(save_directory, entries):
+    """Replace the index journal with one line per save (caller holds the lock)"""
+    data = "".join(
+        json.dumps(dict(name=name, **summary)) + "\n" for name, summary in entries.items()
+    ).encode("utf-8")
+    index_path = os.path.join(save_directory, SAVE_INDEX_FILENAME)
+    _atomic_write(index_path, data, fsync=False)
+    _save_index_sizes[os.path.abspath(index_path)] = len(data)
+
+def _update_save_index(save_directory, records):
+    """Append records to the index journal, building it first if missing"""
+    index_path = os.path.join(save_directory, SAVE_INDEX_FILENAME)
+    with _save_index_lock:
+        if not os.path.exists(index_path):
+            # The rebuild scans the files, so it already includes records
+            rebuild_save_index(save_directory)
+            return
+        with open(index_path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(record) + "\n" for record in records))
+            size = f.tell()
+        # Compact a journal that has more than doubled since it was last replayed
+        if size > 2 * _save_index_sizes.get(os.path.abspath(index_path), 0) + 64 * 1024:
+            _read_save_index(save_directory)
+
+# ============================================================================
+# SAVE DATABASE BACKEND
+# ============================================================================
+
+# A save_directory ending in one of these is a SQLite file holding every
+# character instead of a directory of <name>_save.txt files
+SAVE_DATABASE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+# Open databases: path -> (connection, lock)
+_save_databases = {}
+_save_databases_lock = threading.Lock()
+
+def _is_save_database(save_directory):
+    return str(save_directory).endswith(SAVE_DATABASE_SUFFIXES)
+
+def _open_save_database(path):
+    """Return the shared (connection, lock) for a save database"""
+    path = os.path.abspath(path)
+    with _save_databases_lock:
+        if path not in _save_databases:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS characters ("
+                " name TEXT PRIMARY KEY,"
+                " class TEXT NOT NULL,"
+                " level INTEGER NOT NULL,"
+                " gold INTEGER NOT NULL,"
+                " saved_at REAL NOT NULL,"
+                " data BLOB NOT NULL)"
+            )
+            connection.commit()
+            _save_databases[path] = (connection, threading.Lock())
+        return _save_databases[path]
+
+def close_save_databases():
+    """Close every open save database (they are reopened on next use)"""
+    with _save_databases_lock:
+        for connection, lock in _save_databases.values():
+            with lock:
+                connection.close()
+        _save_databases.clear()
+
+def _database_save(path, entries):
+    """Store (character, encoded save) pairs in one transaction"""
+    now = time.time()
+    rows = [
+        (c["name"], c["class"], c["level"], c["gold"], now, data)
+        for c, data in entries
+    ]
+    connection, lock = _open_save_database(path)
+    with lock, connection:
+        connection.executemany(
+            "INSERT OR REPLACE INTO characters (name, class, level, gold, saved_at, data)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            rows
+        )
+
+def _database_load(path, name):
+    """Return the stored save bytes for name, or None"""
+    if not os.path.exists(path):
+        return None
+    connection, lock = _open_save_database(path)
+    with lock:
+        row = connection.execute(
+            "SELECT data FROM characters WHERE name = ?", (name,)
+        ).fetchone()
+    return None if row is None else bytes(row[0])
+
+def _database_load_many(path, names):
+    """Return name -> stored save bytes for the names that exist"""
+    if not os.path.exists(path):
+        return {}
+    connection, lock = _open_save_database(path)
+    found = {}
+    with lock:
+        for start in range(0, len(names), 500):
+            chunk = names[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = connection.execute(
+                f"SELECT name, data FROM characters WHERE name IN ({placeholders})", chunk
+            ).fetchall()
+            for name, data in rows:
+                found[name] = bytes(data)
+    return found
+
+def _database_summaries(path):
+    """Return name -> summary from the database table, in name order"""
+    if not os.path.exists(path):
+        return {}
+    connection, lock = _open_save_database(path)
+    with lock:
+        rows = connection.execute(
+            "SELECT name, class, level, gold, saved_at, length(data)"
+            " FROM characters ORDER BY name"
+        ).fetchall()
+    return {
+        name: {"class": cls, "level": level, "gold": gold, "saved_at": saved_at, "size": size}
+        for name, cls, level, gold, saved_at, size in rows
+    }
+
+def _database_names(path):
+    if not os.path.exists(path):
+        return []
+    connection, lock = _open_save_database(path)
+    with lock:
+        rows = connection.execute("SELECT name FROM characters ORDER BY name").fetchall()
+    return [row[0] for row in rows]
+
+def _database_has(path, name):
+    if not os.path.exists(path):
+        return False
+    connection, lock = _open_save_database(path)
+    with lock:
+        row = connection.execute("SELECT 1 FROM characters WHERE name = ?", (name,)).fetchone()
+    return row is not None
+
+def _database_delete(path, name):
+    """Delete name, returning False if it was not stored"""
+    if not os.path.exists(path):
+        return False
+    connection, lock = _open_save_database(path)
+    with lock, connection:
+        cursor = connection.execute("DELETE FROM characters WHERE name = ?", (name,))
+    return cursor.rowcount > 0
 
 # ============================================================================
 # CHARACTER OPERATIONS
 # ============================================================================
 
+# Going from level L to L + 1 costs L * XP_PER_LEVEL experience and adds
+# LEVEL_UP_BONUS to the character's stats
+XP_PER_LEVEL = 100
+LEVEL_UP_BONUS = {"max_health": 10, "strength": 2, "magic": 2}
+
+def _cumulative_xp(level):
+    """Total experience needed to reach level from level 1"""
+    return XP_PER_LEVEL * level * (level - 1) // 2
+
+def _level_for_xp(total_xp):
+    """Highest level reachable from level 1 with total_xp experience"""
+    # Largest n with n * (n - 1) <= 2 * total_xp / XP_PER_LEVEL
+    # int() so float experience works like it did with the level-up loop
+    limit = max(0, int(2 * total_xp // XP_PER_LEVEL))
+    return (1 + math.isqrt(1 + 4 * limit)) // 2
+
 def gain_experience(character, xp_amount):
     if character["health"] <= 0:
         raise CharacterDeadError("Cannot gain XP while dead")
 
     character["experience"] += xp_amount
+    old_level = character["level"]
+    mark_dirty(character)
 
-    while character["experience"] >= character["level"] * 100:
-        character["experience"] -= character["level"] * 100
-        character["level"] += 1
-        character["max_health"] += 10
-        character["strength"] += 2
-        character["magic"] += 2
+    # Same result as levelling up one level at a time while experience
+    # covers level * XP_PER_LEVEL, but in closed form
+    total_xp = _cumulative_xp(old_level) + character["experience"]
+    new_level = max(old_level, _level_for_xp(total_xp))
+    if new_level > old_level:
+        gained = new_level - old_level
+        character["experience"] = total_xp - _cumulative_xp(new_level)
+        character["level"] = new_level
+        for stat, bonus in LEVEL_UP_BONUS.items():
+            character[stat] += gained * bonus
         character["health"] = character["max_health"]
 
+    # Let quest_handler's availability tracker pick up level-gated quests
+    tracker = character.get("_available_quests")
+    if tracker is not None and character["level"] != old_level:
+        tracker.level_changed(character, old_level)
+
     return character
     # TODO: Implement experience gain and leveling
     # Check if character is dead first
@@ -189,6 +1363,7 @@ def add_gold(character, amount):
         raise ValueError("Gold cannot be negative")
 
     character["gold"] += amount
+    mark_dirty(character)
     return character["gold"]
     # TODO: Implement gold management
     # Check that result won't be negative
@@ -197,12 +1372,33 @@ def add_gold(character, amount):
 def heal_character(character, amount):
     old_health = character["health"]
     character["health"] = min(character["health"] + amount, character["max_health"])
+    mark_dirty(character)
     return character["health"] - old_health
     # TODO: Implement healing
     # Calculate actual healing (don't exceed max_health)
     # Update character health
     
 
+def display_character_info(character):
+    """Print a character's stats, with gear bonuses shown against base stats"""
+    engine = StatEngine.for_character(character) if character.get("stat_modifiers") else None
+    print(f"\n=== {character['name']} the {character['class']} ===")
+    print(f"Level: {character['level']}  XP: {character['experience']}/{character['level'] * XP_PER_LEVEL}")
+    print(f"Health: {character['health']}/{character['max_health']}")
+    for stat in DERIVED_STATS:
+        label = stat.replace("_", " ").title()
+        value = character[stat]
+        base = engine.base_stat(stat) if engine else value
+        if base == value:
+            print(f"{label}: {value}")
+        else:
+            print(f"{label}: {value} ({base} {'+' if value >= base else '-'} {abs(value - base)})")
+    print(f"Gold: {character['gold']}")
+    for slot in ("weapon", "armor"):
+        equipped = character.get(f"equipped_{slot}")
+        if equipped:
+            print(f"{slot.title()}: {equipped}")
+
 def is_character_dead(character):
     return character["health"] <= 0
     # TODO: Implement death check
@@ -212,6 +1408,7 @@ def revive_character(character):
         return False
 
     character["health"] = character["max_health"] // 2
+    mark_dirty(character)
     return True
     # TODO: Implement revival
     # Restore health to half of max_health
@@ -239,9 +1436,10 @@ def validate_character_data(character):
         if not isinstance(character[field], int):
             raise InvalidSaveDataError(f"Invalid type for {field}")
 
-    list_fields = ["inventory", "active_quests", "completed_quests"]
-    for field in list_fields:
-        if not isinstance(character[field], list):
+    if not isinstance(character["inventory"], (list, Inventory)):
+        raise InvalidSaveDataError("Invalid type for inventory")
+    for field in ["active_quests", "completed_quests"]:
+        if not isinstance(character[field], (list, OrderedIdSet)):
             raise InvalidSaveDataError(f"Invalid type for {field}")
 
     return True
@@ -8,6 +8,8 @@ AI Usage: ChatGPT was used to correct code formatting and exception handling so
 """
 
 import random
+import character_manager
+import game_data
 from custom_exceptions import (
     InvalidTargetError,
     CombatNotActiveError,
@@ -16,25 +18,45 @@ from custom_exceptions import (
 )
 
 # ============================================================================ 
-# ENEMY DEFINITIONS
+# COMBAT RULES
 # ============================================================================
 
-def create_enemy(enemy_type):
-    enemy_type = enemy_type.lower()
+ESCAPE_CHANCE = 0.5
+ROGUE_CRIT_CHANCE = 0.5
+CLERIC_HEAL = 30
 
-    enemies = {
-        "goblin":  {"health": 50,  "strength": 8,  "magic": 2,  "xp_reward": 25,  "gold_reward": 10},
-        "orc":     {"health": 80,  "strength": 12, "magic": 5,  "xp_reward": 50,  "gold_reward": 25},
-        "dragon":  {"health": 200, "strength": 25, "magic": 15, "xp_reward": 200, "gold_reward": 100},
-    }
+def attack_damage(attacker_strength, defender_strength):
+    """Damage of a basic attack: strength minus a quarter of the defender's"""
+    return max(1, attacker_strength - (defender_strength // 4))
+
+def power_strike_damage(strength):
+    """Damage of a Warrior's Power Strike: double strength"""
+    return strength * 2
+
+def fireball_damage(magic):
+    """Damage of a Mage's Fireball: double magic"""
+    return magic * 2
+
+def critical_strike_damage(strength, critical):
+    """Damage of a Rogue's Critical Strike: triple strength if it lands"""
+    return strength * 3 if critical else strength
 
-    if enemy_type not in enemies:
-        raise InvalidTargetError(f"Invalid enemy type: {enemy_type}")
+# ============================================================================ 
+# ENEMY DEFINITIONS
+# ============================================================================
 
-    base = enemies[enemy_type]
+def create_enemy(enemy_type):
+    # Enemy stats come from data/enemies.txt (see game_data.get_enemy_table)
+    enemies = game_data.get_enemy_table()
+    base = enemies.get(enemy_type)
+    if base is None:
+        enemy_type = enemy_type.lower()
+        if enemy_type not in enemies:
+            raise InvalidTargetError(f"Invalid enemy type: {enemy_type}")
+        base = enemies[enemy_type]
 
     return {
-        "name": enemy_type.capitalize(),
+        "name": base["name"],
         "health": base["health"],
         "max_health": base["health"],
         "strength": base["strength"],
@@ -55,23 +77,53 @@ def get_random_enemy_for_level(character_level):
 # COMBAT SYSTEM
 # ============================================================================
 
+# Menu choices accepted from input() or returned by a battle policy
+ACTION_CHOICES = {"attack": "1", "special": "2", "run": "3"}
+
 class SimpleBattle:
     """
     Simple turn-based combat system
+
+    By default the player picks actions from stdin and the battle is
+    printed. Passing a policy runs it headless: the policy is called with
+    the battle each turn and returns "1"/"2"/"3" (or "attack"/"special"/
+    "run"), a list of such actions is played in order, and log lines go to
+    the log callable (or nowhere) instead of being printed.
+
+    Every random draw (escapes, critical strikes) comes from the battle's
+    own random.Random seeded with seed. When no seed is given one is
+    picked and kept in self.seed, so any battle can be replayed exactly.
+    An existing generator may be passed as rng instead.
     """
 
-    def __init__(self, character, enemy):
+    def __init__(self, character, enemy, policy=None, log=None, max_turns=None,
+                 seed=None, rng=None):
         self.character = character
         self.enemy = enemy
+        if rng is None:
+            if seed is None:
+                seed = random.SystemRandom().getrandbits(64)
+            rng = random.Random(seed)
+        self.seed = seed
+        self.rng = rng
         self.combat_active = True
         self.turn = 1
+        if isinstance(policy, (list, tuple)):
+            policy = scripted_policy(policy)
+        self.policy = policy
+        self.interactive = policy is None
+        if log is None:
+            log = display_battle_log if self.interactive else _discard_log
+        self.log = log
+        self.max_turns = max_turns
 
     def start_battle(self):
         if self.character["health"] <= 0:
             raise CharacterDeadError("Character is already dead.")
 
         while self.combat_active:
-            display_combat_stats(self.character, self.enemy)
+            if self.interactive:
+                display_combat_stats(self.character, self.enemy)
 
             result = self.player_turn()
             if result:
@@ -82,79 +134,126 @@ class SimpleBattle:
             if result:
                 return result
 
+            if self.max_turns is not None and self.turn >= self.max_turns:
+                self.combat_active = False
+                self.log("The battle ends in a draw.")
+                return {"winner": "draw", "xp_gained": 0, "gold_gained": 0}
+            self.turn += 1
+
     def player_turn(self):
         if not self.combat_active:
             raise CombatNotActiveError()
 
-        print("\n--- PLAYER TURN ---")
-        print("1. Basic Attack")
-        print("2. Special Ability")
-        print("3. Run")
-
-        choice = input("Choose: ").strip()
+        if self.interactive:
+            print("\n--- PLAYER TURN ---")
+            print("1. Basic Attack")
+            print("2. Special Ability")
+            print("3. Run")
+            choice = input("Choose: ").strip()
+        else:
+            choice = str(self.policy(self)).strip()
+        choice = ACTION_CHOICES.get(choice.lower(), choice)
 
         if choice == "1":
             dmg = self.calculate_damage(self.character, self.enemy)
             self.apply_damage(self.enemy, dmg)
-            display_battle_log(f"You hit the {self.enemy['name']} for {dmg} damage.")
+            self.log(f"You hit the {self.enemy['name']} for {dmg} damage.")
 
         elif choice == "2":
-            msg = use_special_ability(self.character, self.enemy)
-            display_battle_log(msg)
+            msg = use_special_ability(self.character, self.enemy, self.rng)
+            self.log(msg)
 
         elif choice == "3":
             if self.attempt_escape():
-                display_battle_log("You successfully escaped!")
+                self.log("You successfully escaped!")
                 return {"winner": "escape", "xp_gained": 0, "gold_gained": 0}
             else:
-                display_battle_log("You failed to escape!")
+                self.log("You failed to escape!")
 
         else:
-            display_battle_log("Invalid choice. Turn skipped.")
+            self.log("Invalid choice. Turn skipped.")
 
     def enemy_turn(self):
         if not self.combat_active:
             raise CombatNotActiveError()
 
-        print("\n--- ENEMY TURN ---")
+        if self.interactive:
+            print("\n--- ENEMY TURN ---")
         dmg = self.calculate_damage(self.enemy, self.character)
         self.apply_damage(self.character, dmg)
-        display_battle_log(f"{self.enemy['name']} hits you for {dmg} damage!")
+        self.log(f"{self.enemy['name']} hits you for {dmg} damage!")
 
     def calculate_damage(self, attacker, defender):
-        dmg = attacker["strength"] - (defender["strength"] // 4)
-        return max(1, dmg)
+        return attack_damage(attacker["strength"], defender["strength"])
 
     def apply_damage(self, target, damage):
         target["health"] = max(0, target["health"] - damage)
+        # Enemies are never saved, so only the player needs tracking
+        if target is self.character:
+            character_manager.mark_dirty(target)
 
     def check_battle_end(self):
         if self.enemy["health"] <= 0:
             rewards = get_victory_rewards(self.enemy)
             self.character["experience"] += rewards["xp"]
             self.character["gold"] += rewards["gold"]
+            character_manager.mark_dirty(self.character)
             self.combat_active = False
-            display_battle_log("You defeated the enemy!")
+            self.log("You defeated the enemy!")
             return {"winner": "player", **rewards}
 
         if self.character["health"] <= 0:
             self.combat_active = False
-            display_battle_log("You were defeated...")
+            self.log("You were defeated...")
             return {"winner": "enemy", "xp_gained": 0, "gold_gained": 0}
 
         return None
 
     def attempt_escape(self):
-        success = random.random() < 0.5
+        success = self.rng.random() < ESCAPE_CHANCE
         if success:
             self.combat_active = False
         return success
 
+def run_headless_battle(character, enemy, policy, log=None, max_turns=None, seed=None):
+    """
+    Fight a battle without stdin or printing
+
+    Args:
+        policy: Callable taking the battle and returning an action, or a
+                list of actions to play in order
+        log: Optional callable receiving each battle log line
+        max_turns: End the battle as a draw after this many rounds
+        seed: Seed for the battle's random draws (same seed and policy,
+              same battle)
+
+    Returns: The same result dictionary as SimpleBattle.start_battle
+    """
+    battle = SimpleBattle(character, enemy, policy=policy, log=log,
+                          max_turns=max_turns, seed=seed)
+    return battle.start_battle()
+
+def scripted_policy(actions, default="1"):
+    """
+    Build a policy that plays a fixed list of actions
+
+    Once the list runs out every further turn uses default.
+    """
+    remaining = iter(actions)
+
+    def policy(battle):
+        return next(remaining, default)
+
+    return policy
+
+def _discard_log(message):
+    pass
+
 # ============================================================================ 
 # SPECIAL ABILITIES
 # ============================================================================
 
-def use_special_ability(character, enemy):
+def use_special_ability(character, enemy, rng=None):
     cls = character["class"]
 
     if cls == "Warrior":
@@ -162,35 +261,39 @@ def use_special_ability(character, enemy):
     elif cls == "Mage":
         return mage_fireball(character, enemy)
     elif cls == "Rogue":
-        return rogue_critical_strike(character, enemy)
+        return rogue_critical_strike(character, enemy, rng)
     elif cls == "Cleric":
         return cleric_heal(character)
     else:
         return "Your class has no special ability."
 
 def warrior_power_strike(character, enemy):
-    dmg = character["strength"] * 2
+    dmg = power_strike_damage(character["strength"])
     enemy["health"] = max(0, enemy["health"] - dmg)
     return f"Power Strike! You dealt {dmg} damage."
 
 def mage_fireball(character, enemy):
-    dmg = character["magic"] * 2
+    dmg = fireball_damage(character["magic"])
     enemy["health"] = max(0, enemy["health"] - dmg)
     return f"Fireball! You dealt {dmg} magic damage."
 
-def rogue_critical_strike(character, enemy):
-    if random.random() < 0.5:
-        dmg = character["strength"] * 3
+def rogue_critical_strike(character, enemy, rng=None):
+    # rng is the battle's generator; direct calls fall back to the module
+    if rng is None:
+        rng = random
+    if rng.random() < ROGUE_CRIT_CHANCE:
+        dmg = critical_strike_damage(character["strength"], True)
         enemy["health"] = max(0, enemy["health"] - dmg)
         return f"Critical Strike! Triple damage ({dmg})!"
     else:
-        dmg = character["strength"]
+        dmg = critical_strike_damage(character["strength"], False)
         enemy["health"] = max(0, enemy["health"] - dmg)
         return f"Critical failed. You deal normal damage ({dmg})."
 
 def cleric_heal(character):
-    heal = 30
+    heal = CLERIC_HEAL
     character["health"] = min(character["max_health"], character["health"] + heal)
+    character_manager.mark_dirty(character)
     return f"You heal yourself for {heal} HP."
 
 # ============================================================================ 
@@ -213,6 +316,143 @@ def display_combat_stats(character, enemy):
 def display_battle_log(message):
     print(f">>> {message}")
 
+# ============================================================================ 
+# BALANCE SIMULATION
+# ============================================================================
+
+def simulate_battles(character_class, enemy_type, level=1, battles=1000,
+                     action="attack", max_turns=1000, rng=None):
+    """
+    Run many identical battles at once and summarize the outcomes
+
+    The battles advance together one round at a time over plain lists of
+    health values, following the same rules as SimpleBattle: the player
+    acts, the enemy always strikes back, then the enemy's death is checked
+    before the player's. Every battle uses the same constant action
+    ("attack", "special" or "run"). When that action involves no dice
+    (anything but a rogue special or running) one battle is simulated and
+    its result counted for all of them.
+
+    Returns: Dictionary with battles, wins, losses, escapes, draws,
+             win_rate, mean_turns, min_turns, max_turns and turn_counts
+             (turns -> number of battles that lasted that long)
+    """
+    if rng is None:
+        rng = random.Random()
+    action = ACTION_CHOICES.get(action, action)
+
+    character = character_manager.create_character("Simulated", character_class)
+    if level > 1:
+        character_manager.gain_experience(character, 50 * level * (level - 1))
+    enemy = create_enemy(enemy_type)
+
+    player_hit = attack_damage(character["strength"], enemy["strength"])
+    enemy_hit = attack_damage(enemy["strength"], character["strength"])
+    crit = character_class == "Rogue" and action == "2"
+    crit_hit = critical_strike_damage(character["strength"], True)
+    if action == "2":
+        special = {
+            "Warrior": power_strike_damage(character["strength"]),
+            "Mage": fireball_damage(character["magic"]),
+            "Rogue": critical_strike_damage(character["strength"], False),
+        }
+        player_hit = special.get(character_class, 0)
+    heal = CLERIC_HEAL if (action == "2" and character_class == "Cleric") else 0
+
+    simulated = battles
+    if not crit and action != "3":
+        simulated = min(battles, 1)
+
+    player_hp = [character["health"]] * simulated
+    enemy_hp = [enemy["health"]] * simulated
+    max_hp = character["max_health"]
+    live = list(range(simulated))
+    outcome = {"player": 0, "enemy": 0, "escape": 0, "draw": 0}
+    turn_counts = {}
+
+    turn = 0
+    while live and turn < max_turns:
+        turn += 1
+        still_live = []
+        for i in live:
+            if action == "3":
+                if rng.random() < ESCAPE_CHANCE:
+                    outcome["escape"] += 1
+                    turn_counts[turn] = turn_counts.get(turn, 0) + 1
+                    continue
+            elif action == "1" or action == "2":
+                dmg = player_hit
+                if crit and rng.random() < ROGUE_CRIT_CHANCE:
+                    dmg = crit_hit
+                enemy_hp[i] = max(0, enemy_hp[i] - dmg)
+                if heal:
+                    player_hp[i] = min(max_hp, player_hp[i] + heal)
+            player_hp[i] = max(0, player_hp[i] - enemy_hit)
+
+            if enemy_hp[i] <= 0:
+                outcome["player"] += 1
+            elif player_hp[i] <= 0:
+                outcome["enemy"] += 1
+            else:
+                still_live.append(i)
+                continue
+            turn_counts[turn] = turn_counts.get(turn, 0) + 1
+        live = still_live
+
+    if live:
+        outcome["draw"] += len(live)
+        turn_counts[turn] = turn_counts.get(turn, 0) + len(live)
+
+    if simulated != battles:
+        scale = battles // max(simulated, 1)
+        outcome = {key: count * scale for key, count in outcome.items()}
+        turn_counts = {key: count * scale for key, count in turn_counts.items()}
+
+    total_turns = sum(turns * count for turns, count in turn_counts.items())
+    return {
+        "battles": battles,
+        "wins": outcome["player"],
+        "losses": outcome["enemy"],
+        "escapes": outcome["escape"],
+        "draws": outcome["draw"],
+        "win_rate": outcome["player"] / battles if battles else 0.0,
+        "mean_turns": total_turns / battles if battles else 0.0,
+        "min_turns": min(turn_counts) if turn_counts else 0,
+        "max_turns": max(turn_counts) if turn_counts else 0,
+        "turn_counts": turn_counts
+    }
+
+def simulate_matchups(classes=None, enemy_types=None,
+                      levels=(1,), battles=1000, action="attack",
+                      max_turns=1000, seed=None):
+    """
+    Run simulate_battles for every class x enemy type x level pairing
+
+    classes and enemy_types default to every defined class and enemy.
+
+    Each pairing draws from its own generator derived from seed and the
+    pairing, so its result does not depend on which other pairings are
+    run or in what order (pairings can be split across workers).
+
+    Returns: Dictionary keyed by (class, enemy_type, level)
+    """
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    if classes is None:
+        classes = list(game_data.get_class_table())
+    if enemy_types is None:
+        enemy_types = list(game_data.get_enemy_table())
+    results = {}
+    for character_class in classes:
+        for enemy_type in enemy_types:
+            for level in levels:
+                rng = random.Random(f"{seed}:{character_class}:{enemy_type}:{level}")
+                results[(character_class, enemy_type, level)] = simulate_battles(
+                    character_class, enemy_type, level, battles,
+                    action=action, max_turns=max_turns, rng=rng
+                )
+    return results
+
 # ============================================================================ 
 # MAIN TEST BLOCK
 # ============================================================================
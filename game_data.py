@@ -10,6 +10,10 @@ This module handles loading and validating game data from text files.
 """
 
 import os
+import json
+import hashlib
+from types import MappingProxyType
+from concurrent.futures import ProcessPoolExecutor
 from custom_exceptions import (
     InvalidDataFormatError,
     MissingDataFileError,
@@ -20,49 +24,336 @@ from custom_exceptions import (
 # DATA LOADING FUNCTIONS
 # ============================================================================
 
-def load_quests(filename="data/quests.txt"):
+def load_quests(filename="data/quests.txt", use_cache=True):
+    quests, line_numbers = _load_data_file(filename, "quest", use_cache)
+    return quests
+
+def load_items(filename="data/items.txt", use_cache=True):
+    items, line_numbers = _load_data_file(filename, "item", use_cache)
+    return items
+
+def load_classes(filename="data/classes.txt", use_cache=True):
+    classes, line_numbers = _load_data_file(filename, "class", use_cache)
+    return classes
+
+def load_enemies(filename="data/enemies.txt", use_cache=True):
+    enemies, line_numbers = _load_data_file(filename, "enemy", use_cache)
+    return enemies
+
+def load_content_dir(path="data", workers=None, use_cache=True):
+    """
+    Load every quest and item shard in a content directory
+
+    Shards are files named quests.txt / quests_*.txt and items.txt /
+    items_*.txt (for example quests_north.txt, items_expansion1.txt).
+    They are parsed concurrently in a process pool and merged into the
+    same quest_id / item_id keyed dictionaries load_quests and load_items
+    return.
+
+    Args:
+        path: Directory holding the shards
+        workers: Number of worker processes (defaults to the CPU count);
+                 1 parses everything in the current process
+        use_cache: Use the compiled cache for each shard
+
+    Returns: Tuple of (quests, items)
+    Raises:
+        MissingDataFileError if path is not a directory
+        InvalidDataFormatError if a shard is malformed or an ID is
+            defined by more than one shard (every location is listed)
+    """
+    if not os.path.isdir(path):
+        raise MissingDataFileError(f"{path} not found")
+
+    shards = []
+    for name in sorted(os.listdir(path)):
+        for kind, prefix in (("quest", "quests"), ("item", "items")):
+            if name == f"{prefix}.txt" or (name.startswith(f"{prefix}_") and name.endswith(".txt")):
+                shards.append((os.path.join(path, name), kind))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    jobs = [(filename, kind, use_cache) for filename, kind in shards]
+    if workers <= 1 or len(jobs) <= 1:
+        results = [_load_shard(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(pool.map(_load_shard, jobs))
+
+    merged = {"quest": {}, "item": {}}
+    defined_at = {"quest": {}, "item": {}}
+    duplicates = []
+    for (filename, kind), (records, line_numbers) in zip(shards, results):
+        for record_id, record in records.items():
+            location = f"{filename} line {line_numbers[record_id]}"
+            if record_id in merged[kind]:
+                duplicates.append(
+                    f"{kind}_id '{record_id}' defined in {defined_at[kind][record_id]} and {location}"
+                )
+                continue
+            merged[kind][record_id] = record
+            defined_at[kind][record_id] = location
+
+    if duplicates:
+        raise InvalidDataFormatError("Duplicate IDs across shards: " + "; ".join(duplicates))
+
+    return merged["quest"], merged["item"]
+
+def _load_shard(job):
+    """Process pool entry point for load_content_dir"""
+    filename, kind, use_cache = job
+    return _load_data_file(filename, kind, use_cache)
+
+def _load_data_file(filename, kind, use_cache):
+    """
+    Load a quest or item file, going through the compiled cache
+
+    Args:
+        kind: "quest", "item", "class" or "enemy"
+
+    Returns: Tuple of (records keyed by ID, line number of each record)
+    """
     if not os.path.exists(filename):
         raise MissingDataFileError(f"{filename} not found")
 
-    try:
-        with open(filename, "r") as f:
-            content = f.read()
-    except Exception:
-        raise CorruptedDataError(f"Cannot read {filename}")
-
-    quests = {}
-    blocks = content.strip().split("\n\n")
-    for block in blocks:
+    signature = None
+    if use_cache:
         try:
-            quest = parse_quest_block(block.splitlines())
-            validate_quest_data(quest)
-            quests[quest["quest_id"]] = quest
-        except InvalidDataFormatError as e:
-            raise InvalidDataFormatError(f"In {filename}: {e}")
+            signature = _source_signature(filename)
+        except OSError:
+            raise CorruptedDataError(f"Cannot read {filename}")
+        cached = _read_cache(filename, signature)
+        if cached is not None:
+            return cached
+
+    if kind == "quest":
+        parse_block, validate_record = parse_quest_block, validate_quest_data
+    elif kind == "item":
+        parse_block, validate_record = parse_item_block, validate_item_data
+    elif kind == "class":
+        parse_block, validate_record = parse_class_block, validate_class_data
+    else:
+        parse_block, validate_record = parse_enemy_block, validate_enemy_data
+    id_field = f"{kind}_id"
+
+    records = {}
+    line_numbers = {}
+    for line_number, record in _iter_records(filename, parse_block, validate_record):
+        records[record[id_field]] = record
+        line_numbers[record[id_field]] = line_number
+
+    if use_cache:
+        _write_cache(filename, (records, line_numbers), signature)
+    return records, line_numbers
 
-    return quests
+# ============================================================================
+# DEFINITION TABLES
+# ============================================================================
+
+CLASSES_FILE = "data/classes.txt"
+ENEMIES_FILE = "data/enemies.txt"
+
+_class_table = None
+_enemy_table = None
+
+def get_class_table():
+    """
+    Return the character class definitions, loading them on first use
+
+    Returns: Read-only mapping of class name -> read-only record with
+             class_id, health, strength and magic
+    Raises:
+        MissingDataFileError if classes.txt does not exist
+        InvalidDataFormatError if classes.txt is malformed
+    """
+    global _class_table
+    if _class_table is None:
+        _class_table = _freeze_table(load_classes(CLASSES_FILE))
+    return _class_table
+
+def get_enemy_table():
+    """
+    Return the enemy definitions, loading them on first use
+
+    Returns: Read-only mapping of lowercase enemy type -> read-only record
+             with enemy_id, name, health, strength, magic, xp_reward and
+             gold_reward
+    Raises:
+        MissingDataFileError if enemies.txt does not exist
+        InvalidDataFormatError if enemies.txt is malformed
+    """
+    global _enemy_table
+    if _enemy_table is None:
+        _enemy_table = _freeze_table(load_enemies(ENEMIES_FILE))
+    return _enemy_table
+
+def reload_definition_tables():
+    """Forget the loaded class and enemy tables so they are read again"""
+    global _class_table, _enemy_table
+    _class_table = None
+    _enemy_table = None
+
+def _freeze_table(records):
+    return MappingProxyType({
+        record_id: MappingProxyType(dict(record)) for record_id, record in records.items()
+    })
 
-def load_items(filename="data/items.txt"):
+# ============================================================================
+# STREAMING PARSERS
+# ============================================================================
+
+def iter_quests(filename="data/quests.txt"):
+    """
+    Yield validated quests from a quest file one at a time
+
+    The file is read line by line, so only the block being parsed is held
+    in memory no matter how large the file is.
+
+    Raises:
+        MissingDataFileError if the file does not exist
+        CorruptedDataError if the file cannot be read
+        InvalidDataFormatError if a block is malformed
+    """
+    for line_number, quest in _iter_records(filename, parse_quest_block, validate_quest_data):
+        yield quest
+
+def iter_items(filename="data/items.txt"):
+    """
+    Yield validated items from an item file one at a time
+
+    Same guarantees and exceptions as iter_quests.
+    """
+    for line_number, item in _iter_records(filename, parse_item_block, validate_item_data):
+        yield item
+
+def _iter_records(filename, parse_block, validate_record):
+    """
+    Parse and validate every block of a data file
+
+    Yields: Tuples of (line_number, record) where line_number is the
+            first line of the block in the file
+    """
     if not os.path.exists(filename):
         raise MissingDataFileError(f"{filename} not found")
 
+    for line_number, lines in _iter_blocks(filename):
+        try:
+            record = parse_block(lines)
+            validate_record(record)
+        except InvalidDataFormatError as e:
+            raise InvalidDataFormatError(f"In {filename}, line {line_number}: {e}")
+        yield line_number, record
+
+def _iter_blocks(filename):
+    """
+    Split a data file into blank-line separated blocks while reading it
+
+    Yields: Tuples of (first_line_number, list_of_lines)
+    """
     try:
-        with open(filename, "r") as f:
-            content = f.read()
+        f = open(filename, "r")
     except Exception:
         raise CorruptedDataError(f"Cannot read {filename}")
 
-    items = {}
-    blocks = content.strip().split("\n\n")
-    for block in blocks:
+    with f:
+        block = []
+        start = 0
         try:
-            item = parse_item_block(block.splitlines())
-            validate_item_data(item)
-            items[item["item_id"]] = item
-        except InvalidDataFormatError as e:
-            raise InvalidDataFormatError(f"In {filename}: {e}")
+            for line_number, line in enumerate(f, 1):
+                line = line.rstrip("\r\n")
+                if not line.strip():
+                    if block:
+                        yield start, block
+                        block = []
+                    continue
+                if not block:
+                    start = line_number
+                block.append(line)
+        except (OSError, UnicodeDecodeError):
+            raise CorruptedDataError(f"Cannot read {filename}")
+        if block:
+            yield start, block
 
-    return items
+# ============================================================================
+# COMPILED DATA CACHE
+# ============================================================================
+
+# Bump whenever the parsed record layout changes so old caches are ignored.
+# The cache is plain JSON: data directories may come from content packs, so
+# loading a cache must never be able to run code.
+CACHE_VERSION = 4
+CACHE_SUFFIX = ".cache"
+
+def get_cache_path(filename):
+    """Return the path of the compiled cache that sits next to filename"""
+    return filename + CACHE_SUFFIX
+
+def _source_signature(filename):
+    """
+    Describe the current contents of a data file
+
+    Returns: Tuple of (mtime_ns, size, sha256 hex digest)
+    """
+    stat = os.stat(filename)
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return stat.st_mtime_ns, stat.st_size, digest.hexdigest()
+
+def _read_cache(filename, signature):
+    """
+    Load already-validated records from the compiled cache
+
+    signature is the current _source_signature of filename.
+
+    Returns: The cached records, or None if the cache is missing, stale
+             or unreadable (the caller then falls back to the text parser)
+    """
+    cache_path = get_cache_path(filename)
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("version") != CACHE_VERSION:
+            return None
+        if cached.get("signature") != list(signature):
+            return None
+        records, line_numbers = cached["records"]
+        for record in records.values():
+            # JSON has no tuples; modifiers are ((stat, delta), ...)
+            if "modifiers" in record:
+                record["modifiers"] = tuple(tuple(pair) for pair in record["modifiers"])
+        return records, line_numbers
+    except Exception:
+        return None
+
+def _write_cache(filename, records, signature):
+    """
+    Store parsed records next to filename
+
+    signature must be taken before the source was parsed, so an edit made
+    while parsing leaves a cache that no longer matches.
+
+    The cache is only an optimization, so failures (read-only data
+    directory, full disk) are ignored. The file is written under a
+    temporary name and renamed so readers never see a partial cache.
+    """
+    cache_path = get_cache_path(filename)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": CACHE_VERSION, "signature": signature, "records": records},
+                f
+            )
+        os.replace(temp_path, cache_path)
+    except Exception:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
 
 # ============================================================================
 # VALIDATION
@@ -100,6 +391,37 @@ def validate_item_data(item_dict):
     except Exception:
         raise InvalidDataFormatError("Cost must be an integer")
 
+    # Parsed once here so the inventory functions never re-split the string
+    item_dict["modifiers"] = parse_item_modifiers(item_dict["effect"])
+
+    return True
+
+def validate_class_data(class_dict):
+    required_fields = ["class_id", "health", "strength", "magic"]
+    for field in required_fields:
+        if field not in class_dict:
+            raise InvalidDataFormatError(f"Missing field: {field}")
+
+    for field in ["health", "strength", "magic"]:
+        try:
+            class_dict[field] = int(class_dict[field])
+        except Exception:
+            raise InvalidDataFormatError(f"{field} must be an integer")
+
+    return True
+
+def validate_enemy_data(enemy_dict):
+    required_fields = ["enemy_id", "name", "health", "strength", "magic", "xp_reward", "gold_reward"]
+    for field in required_fields:
+        if field not in enemy_dict:
+            raise InvalidDataFormatError(f"Missing field: {field}")
+
+    for field in ["health", "strength", "magic", "xp_reward", "gold_reward"]:
+        try:
+            enemy_dict[field] = int(enemy_dict[field])
+        except Exception:
+            raise InvalidDataFormatError(f"{field} must be an integer")
+
     return True
 
 # ============================================================================
@@ -134,6 +456,60 @@ DESCRIPTION: Restores 20 HP.
         with open(items_file, "w") as f:
             f.write(default_items)
 
+    classes_file = "data/classes.txt"
+    if not os.path.exists(classes_file):
+        default_classes = """CLASS_ID: Warrior
+HEALTH: 120
+STRENGTH: 15
+MAGIC: 5
+
+CLASS_ID: Mage
+HEALTH: 80
+STRENGTH: 8
+MAGIC: 20
+
+CLASS_ID: Rogue
+HEALTH: 90
+STRENGTH: 12
+MAGIC: 10
+
+CLASS_ID: Cleric
+HEALTH: 100
+STRENGTH: 10
+MAGIC: 15
+"""
+        with open(classes_file, "w") as f:
+            f.write(default_classes)
+
+    enemies_file = "data/enemies.txt"
+    if not os.path.exists(enemies_file):
+        default_enemies = """ENEMY_ID: goblin
+NAME: Goblin
+HEALTH: 50
+STRENGTH: 8
+MAGIC: 2
+XP_REWARD: 25
+GOLD_REWARD: 10
+
+ENEMY_ID: orc
+NAME: Orc
+HEALTH: 80
+STRENGTH: 12
+MAGIC: 5
+XP_REWARD: 50
+GOLD_REWARD: 25
+
+ENEMY_ID: dragon
+NAME: Dragon
+HEALTH: 200
+STRENGTH: 25
+MAGIC: 15
+XP_REWARD: 200
+GOLD_REWARD: 100
+"""
+        with open(enemies_file, "w") as f:
+            f.write(default_enemies)
+
 # ============================================================================
 # PARSING HELPERS
 # ============================================================================
@@ -169,6 +545,52 @@ def parse_item_block(lines):
     item["description"] = item.pop("description")
     return item
 
+def parse_item_modifiers(effect_string):
+    """
+    Parse an item EFFECT into stat modifiers
+
+    Args:
+        effect_string: "stat:value", or several separated by commas
+                       ("strength:3,magic:2")
+
+    Returns: Tuple of (stat_name, delta) pairs
+    Example: "health:20" -> (("health", 20),)
+    Raises: InvalidDataFormatError if a modifier is not stat:integer
+    """
+    modifiers = []
+    for part in str(effect_string).split(","):
+        stat, separator, value = part.partition(":")
+        stat = stat.strip()
+        try:
+            if not separator or not stat:
+                raise ValueError
+            modifiers.append((stat, int(value.strip())))
+        except ValueError:
+            raise InvalidDataFormatError(f"Invalid effect: {effect_string}")
+    return tuple(modifiers)
+
+def parse_class_block(lines):
+    character_class = {}
+    for line in lines:
+        if ": " not in line:
+            raise InvalidDataFormatError(f"Invalid line: {line}")
+        key, value = line.split(": ", 1)
+        character_class[key.lower()] = value
+    return character_class
+
+def parse_enemy_block(lines):
+    enemy = {}
+    for line in lines:
+        if ": " not in line:
+            raise InvalidDataFormatError(f"Invalid line: {line}")
+        key, value = line.split(": ", 1)
+        enemy[key.lower()] = value
+    # Enemy types are looked up case-insensitively
+    if "enemy_id" in enemy:
+        enemy["enemy_id"] = enemy["enemy_id"].lower()
+        enemy.setdefault("name", enemy["enemy_id"].capitalize())
+    return enemy
+
 # ============================================================================
 # TESTING
 # ============================================================================
@@ -1,3 +1,5 @@
+import bisect
+import game_data
 from custom_exceptions import (
     InventoryFullError,
     ItemNotFoundError,
@@ -8,6 +10,210 @@ from custom_exceptions import (
 # Maximum inventory size
 MAX_INVENTORY_SIZE = 20
 
+# ============================================================================
+# INVENTORY CONTAINER
+# ============================================================================
+
+class Inventory:
+    """
+    Item ID -> quantity map with the list methods the game uses
+
+    A character's inventory used to be a flat list of item IDs. This keeps
+    that interface (in, len, append, remove, count, iteration) but stores
+    counts plus a running total, so has_item, count_item, removal and the
+    MAX_INVENTORY_SIZE check are O(1). Iterating yields each ID once per
+    copy held, so save_character still writes the same comma-separated
+    list.
+    """
+
+    def __init__(self, item_ids=()):
+        self._counts = {}
+        self._total = 0
+        for item_id in item_ids:
+            self.add(item_id)
+
+    def __contains__(self, item_id):
+        return item_id in self._counts
+
+    def __len__(self):
+        return self._total
+
+    def __iter__(self):
+        for item_id, quantity in self._counts.items():
+            for _ in range(quantity):
+                yield item_id
+
+    def __eq__(self, other):
+        if isinstance(other, Inventory):
+            return self._counts == other._counts
+        if isinstance(other, list):
+            return self == Inventory(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Inventory({self._counts!r})"
+
+    def add(self, item_id, quantity=1):
+        """Add copies of an item, raising ValueError if quantity is below 1"""
+        if quantity < 1:
+            raise ValueError(f"Invalid quantity: {quantity!r}")
+        self._counts[item_id] = self._counts.get(item_id, 0) + quantity
+        self._total += quantity
+
+    def append(self, item_id):
+        self.add(item_id)
+
+    def remove(self, item_id, quantity=1):
+        """Remove copies of an item, raising ValueError if there are too few"""
+        if quantity < 1:
+            raise ValueError(f"Invalid quantity: {quantity!r}")
+        held = self._counts.get(item_id, 0)
+        if held < quantity:
+            raise ValueError(f"{item_id!r} not in inventory")
+        if held == quantity:
+            del self._counts[item_id]
+        else:
+            self._counts[item_id] = held - quantity
+        self._total -= quantity
+
+    def count(self, item_id):
+        return self._counts.get(item_id, 0)
+
+    def items(self):
+        """Return (item_id, quantity) pairs in the order items were first added"""
+        return self._counts.items()
+
+    def copy(self):
+        copied = Inventory()
+        copied._counts = dict(self._counts)
+        copied._total = self._total
+        return copied
+
+    def clear(self):
+        self._counts.clear()
+        self._total = 0
+
+# ============================================================================
+# STAT ENGINE
+# ============================================================================
+
+# Stats that gear and buffs modify by default
+DERIVED_STATS = ("strength", "magic", "max_health")
+
+class StatEngine:
+    """
+    Base stats plus modifier stacks for one character
+
+    Modifiers are grouped by source ("weapon", "armor", "buff:bless", ...)
+    in character['stat_modifiers'], so they are saved with the character.
+    The character's own stat fields hold the effective values (base plus
+    every modifier) and act as the cache: they are only recomputed when a
+    modifier is added or removed, so combat and display code keep reading
+    character['strength'] directly.
+
+    Code that changes a stat field directly (levelling up, consumables)
+    changes the base stat; the engine notices the difference the next time
+    it is used. Use StatEngine.for_character rather than the constructor so
+    a character has a single engine (stored under '_stat_engine', which is
+    not saved).
+
+    Like Inventory, this lives here rather than in character_manager
+    because character_manager imports this module.
+    """
+
+    def __init__(self, character):
+        self.character = character
+        self.stacks = character.setdefault('stat_modifiers', {})
+        totals = self._totals()
+        # The dictionary holds effective values, so the base is what is left
+        # after taking every recorded modifier off
+        self.base = {
+            stat: character[stat] - totals.get(stat, 0)
+            for stat in set(DERIVED_STATS) | set(totals) if stat in character
+        }
+        self._written = {stat: character[stat] for stat in self.base}
+
+    @classmethod
+    def for_character(cls, character):
+        engine = character.get('_stat_engine')
+        if (engine is None or engine.character is not character
+                or engine.stacks is not character.get('stat_modifiers')):
+            engine = cls(character)
+            character['_stat_engine'] = engine
+        return engine
+
+    def base_stat(self, stat):
+        """Return a stat without any modifiers"""
+        self._sync()
+        return self.base.get(stat, self.character.get(stat))
+
+    def effective_stat(self, stat):
+        """Return a stat with every modifier applied"""
+        self._sync()
+        return self.character[stat]
+
+    def modifiers(self, source):
+        return self.stacks.get(source, ())
+
+    def set_modifiers(self, source, modifiers):
+        """
+        Replace the modifiers from source and update the effective stats
+
+        Raises: ValueError if source contains a comma, which saves use as
+                the separator between modifiers
+        """
+        if "," in source:
+            raise ValueError(f"Modifier source cannot contain ',': {source!r}")
+        self._sync()
+        modifiers = tuple(modifiers)
+        for stat, value in modifiers:
+            if stat not in self.base:
+                self.base[stat] = self.character[stat]
+        self.stacks[source] = modifiers
+        self._apply()
+
+    def remove_modifiers(self, source):
+        """
+        Remove the modifiers from source and update the effective stats
+
+        Returns: The removed modifiers (empty if source had none)
+        """
+        self._sync()
+        removed = self.stacks.pop(source, ())
+        if removed:
+            self._apply()
+        return removed
+
+    def _totals(self):
+        totals = {}
+        for modifiers in self.stacks.values():
+            for stat, value in modifiers:
+                totals[stat] = totals.get(stat, 0) + value
+        return totals
+
+    def _sync(self):
+        # Fold direct edits of the stat fields into the base stats
+        for stat, written in self._written.items():
+            current = self.character[stat]
+            if current != written:
+                self.base[stat] += current - written
+                self._written[stat] = current
+
+    def _apply(self):
+        totals = self._totals()
+        for stat, base in self.base.items():
+            value = base + totals.get(stat, 0)
+            self.character[stat] = value
+            self._written[stat] = value
+        _mark_dirty(self.character)
+
+def _mark_dirty(character):
+    # Same as character_manager.mark_dirty; importing character_manager
+    # here would be circular because it imports Inventory from this module
+    character['_version'] = character.get('_version', 0) + 1
+
 # ============================================================================
 # INVENTORY MANAGEMENT
 # ============================================================================
@@ -29,6 +235,7 @@ def add_item_to_inventory(character, item_id):
     if len(character['inventory']) >= MAX_INVENTORY_SIZE:
         raise InventoryFullError("Inventory is full")
     character['inventory'].append(item_id)
+    _mark_dirty(character)
     return True
 
 def remove_item_from_inventory(character, item_id):
@@ -48,6 +255,7 @@ def remove_item_from_inventory(character, item_id):
     if item_id not in character['inventory']:
         raise ItemNotFoundError(f"{item_id} not in inventory")
     character['inventory'].remove(item_id)
+    _mark_dirty(character)
     return True
 
 def has_item(character, item_id):
@@ -87,8 +295,9 @@ def clear_inventory(character):
     # TODO: Implement inventory clearing
     # Save current inventory before clearing
     # Clear character's inventory list
-    removed = character['inventory'].copy()
+    removed = list(character['inventory'])
     character['inventory'].clear()
+    _mark_dirty(character)
     return removed
 
 # ============================================================================
@@ -111,6 +320,18 @@ def parse_item_effect(effect_string):
     stat, value = effect_string.split(":")
     return stat.strip(), int(value.strip())
 
+def get_item_modifiers(item_data):
+    """
+    Return an item's stat modifiers as a tuple of (stat_name, value) pairs
+
+    Items from game_data.load_items carry them pre-parsed under
+    'modifiers'; hand-built item dictionaries are parsed from 'effect'.
+    """
+    modifiers = item_data.get('modifiers')
+    if modifiers is None:
+        modifiers = game_data.parse_item_modifiers(item_data['effect'])
+    return modifiers
+
 def apply_stat_effect(character, stat_name, value):
     """
     Apply a stat modification to character
@@ -128,6 +349,7 @@ def apply_stat_effect(character, stat_name, value):
         character['health'] = min(character['health'] + value, character['max_health'])
     else:
         character[stat_name] += value
+    _mark_dirty(character)
 
 def use_item(character, item_id, item_data):
     """
@@ -157,10 +379,12 @@ def use_item(character, item_id, item_data):
         raise ItemNotFoundError(f"{item_id} not in inventory")
     if item_data['type'] != 'consumable':
         raise InvalidItemTypeError(f"{item_id} is not consumable")
-    stat, value = parse_item_effect(item_data['effect'])
-    apply_stat_effect(character, stat, value)
+    modifiers = get_item_modifiers(item_data)
+    for stat, value in modifiers:
+        apply_stat_effect(character, stat, value)
     remove_item_from_inventory(character, item_id)
-    return f"Used {item_id}! {stat} increased by {value}"
+    changes = ", ".join(f"{stat} increased by {value}" for stat, value in modifiers)
+    return f"Used {item_id}! {changes}"
 
 def equip_weapon(character, item_id, item_data):
     """
@@ -192,12 +416,12 @@ def equip_weapon(character, item_id, item_data):
         raise ItemNotFoundError(f"{item_id} not in inventory")
     if item_data['type'] != 'weapon':
         raise InvalidItemTypeError(f"{item_id} is not a weapon")
+    modifiers = get_item_modifiers(item_data)
+    # Taking the new weapon out first frees a slot for the old one
+    remove_item_from_inventory(character, item_id)
     if 'equipped_weapon' in character and character['equipped_weapon']:
         unequip_weapon(character)
-    stat, value = parse_item_effect(item_data['effect'])
-    character[stat] += value
-    character['equipped_weapon'] = item_id
-    remove_item_from_inventory(character, item_id)
+    _equip(character, "weapon", item_id, modifiers)
     return f"Equipped weapon {item_id}"
 
 def equip_armor(character, item_id, item_data):
@@ -226,13 +450,12 @@ def equip_armor(character, item_id, item_data):
         raise ItemNotFoundError(f"{item_id} not in inventory")
     if item_data['type'] != 'armor':
         raise InvalidItemTypeError(f"{item_id} is not armor")
+    modifiers = get_item_modifiers(item_data)
+    remove_item_from_inventory(character, item_id)
     if 'equipped_armor' in character and character['equipped_armor']:
         unequip_armor(character)
-    stat, value = parse_item_effect(item_data['effect'])
-    character[stat] += value
-    character['equipped_armor'] = {"item_id": item_id, "effect": item_data['effect']}
-    remove_item_from_inventory(character, item_id)
-    return f"Equipped armor {item_data['name']}"
+    _equip(character, "armor", item_id, modifiers)
+    return f"Equipped armor {item_data.get('name', item_id)}"
 
 def unequip_weapon(character):
     """
@@ -248,14 +471,9 @@ def unequip_weapon(character):
     # Clear equipped_weapon from character
     if 'equipped_weapon' not in character or not character['equipped_weapon']:
         return None
-    item_id = character['equipped_weapon']['item_id']
-    stat, value = parse_item_effect(character['equipped_weapon']['effect'])
-    character[stat] -= value
     if len(character['inventory']) >= MAX_INVENTORY_SIZE:
         raise InventoryFullError("Inventory full, cannot unequip weapon")
-    character['inventory'].append(item_id)
-    character['equipped_weapon'] = None
-    return item_id
+    return _unequip(character, "weapon")
 
 def unequip_armor(character):
     """
@@ -267,13 +485,29 @@ def unequip_armor(character):
     # TODO: Implement armor unequipping
     if 'equipped_armor' not in character or not character['equipped_armor']:
         return None
-    item_id = character['equipped_armor']['item_id']
-    stat, value = parse_item_effect(character['equipped_armor']['effect'])
-    character[stat] -= value
     if len(character['inventory']) >= MAX_INVENTORY_SIZE:
         raise InventoryFullError("Inventory full, cannot unequip armor")
+    return _unequip(character, "armor")
+
+def _equip(character, slot, item_id, modifiers):
+    """
+    Put an item's modifiers on the character's StatEngine under slot
+
+    The recorded modifiers are what _unequip takes off again, so the item
+    data is not needed (or re-parsed) to unequip.
+    """
+    # Like apply_stat_effect, stats the character does not have are ignored
+    applied = tuple((stat, value) for stat, value in modifiers if stat in character)
+    StatEngine.for_character(character).set_modifiers(slot, applied)
+    character[f'equipped_{slot}'] = item_id
+    _mark_dirty(character)
+
+def _unequip(character, slot):
+    item_id = character[f'equipped_{slot}']
+    StatEngine.for_character(character).remove_modifiers(slot)
     character['inventory'].append(item_id)
-    character['equipped_armor'] = None
+    character[f'equipped_{slot}'] = None
+    _mark_dirty(character)
     return item_id
 
 def purchase_item(character, item_id, item_data):
@@ -302,6 +536,7 @@ def purchase_item(character, item_id, item_data):
         raise InventoryFullError("Inventory full")
     character['gold'] -= cost
     add_item_to_inventory(character, item_id)
+    _mark_dirty(character)
     return True
 
 def sell_item(character, item_id, item_data):
@@ -326,8 +561,209 @@ def sell_item(character, item_id, item_data):
     gold_received = int(item_data['cost']) // 2
     remove_item_from_inventory(character, item_id)
     character['gold'] += gold_received
+    _mark_dirty(character)
     return gold_received
 
+def purchase_items(character, order, item_catalog):
+    """
+    Buy several items in one all-or-nothing transaction
+
+    Cost and inventory space are checked once for the whole order; if any
+    check fails nothing is bought.
+
+    Args:
+        character: Character dictionary
+        order: List of (item_id, quantity) pairs
+        item_catalog: Dictionary of item_id -> item data with 'cost'
+
+    Returns: Receipt dictionary with 'lines' (item_id, quantity, unit
+             price, line total), 'total' cost and 'gold' left
+    Raises:
+        ItemNotFoundError if an item is not in the catalog
+        ValueError if a quantity is not a positive integer
+        InsufficientResourcesError if the order costs more than the gold held
+        InventoryFullError if the items do not all fit
+    """
+    lines = _price_order(order, item_catalog, lambda cost: cost)
+    total = sum(line[3] for line in lines)
+    quantity = sum(line[1] for line in lines)
+    if character['gold'] < total:
+        raise InsufficientResourcesError(f"Order costs {total} gold, you have {character['gold']}")
+    if len(character['inventory']) + quantity > MAX_INVENTORY_SIZE:
+        raise InventoryFullError(f"Not enough space for {quantity} items")
+
+    inventory = character['inventory']
+    for item_id, count, price, line_total in lines:
+        if isinstance(inventory, Inventory):
+            inventory.add(item_id, count)
+        else:
+            inventory.extend([item_id] * count)
+    character['gold'] -= total
+    _mark_dirty(character)
+    return {"lines": lines, "total": total, "gold": character['gold']}
+
+def sell_items(character, order, item_catalog):
+    """
+    Sell several items in one all-or-nothing transaction
+
+    Every item is sold for half its cost, like sell_item. If the character
+    does not hold enough of any item, nothing is sold.
+
+    Returns: Receipt dictionary with 'lines' (item_id, quantity, unit
+             price, line total), 'total' gold received and 'gold' now held
+    Raises:
+        ItemNotFoundError if an item is not in the catalog or not held in
+            the quantity being sold
+        ValueError if a quantity is not a positive integer
+    """
+    lines = _price_order(order, item_catalog, lambda cost: cost // 2)
+    needed = {}
+    for item_id, count, price, line_total in lines:
+        needed[item_id] = needed.get(item_id, 0) + count
+    inventory = character['inventory']
+    for item_id, count in needed.items():
+        if inventory.count(item_id) < count:
+            raise ItemNotFoundError(f"Not enough {item_id} to sell {count}")
+
+    for item_id, count in needed.items():
+        if isinstance(inventory, Inventory):
+            inventory.remove(item_id, count)
+        else:
+            for _ in range(count):
+                inventory.remove(item_id)
+    total = sum(line[3] for line in lines)
+    character['gold'] += total
+    _mark_dirty(character)
+    return {"lines": lines, "total": total, "gold": character['gold']}
+
+def _price_order(order, item_catalog, unit_price):
+    """Validate an order and return (item_id, quantity, price, line_total) lines"""
+    lines = []
+    for item_id, quantity in order:
+        if item_id not in item_catalog:
+            raise ItemNotFoundError(f"{item_id} is not sold here")
+        if not isinstance(quantity, int) or isinstance(quantity, bool) or quantity <= 0:
+            raise ValueError(f"Invalid quantity for {item_id}: {quantity!r}")
+        price = unit_price(int(item_catalog[item_id]['cost']))
+        lines.append((item_id, quantity, price, price * quantity))
+    return lines
+
+# ============================================================================
+# SHOP CATALOG
+# ============================================================================
+
+class ShopCatalog:
+    """
+    Shop listings over the items from game_data.load_items
+
+    Item IDs are kept sorted by (cost, item_id), once for the whole catalog
+    and once per item type, so a query such as "weapons costing at most N
+    gold" is two binary searches plus a slice: O(log n + k) for k results.
+    Listing lines are formatted once per item type and sliced for each
+    page, price band included, until the catalog changes (add_item /
+    remove_item).
+    """
+
+    PAGE_SIZE = 10
+
+    def __init__(self, items):
+        self.items = {}
+        self._index = {None: []}
+        self._lines = {}
+        for item_id, item in items.items():
+            self._insert(item_id, item)
+
+    def __contains__(self, item_id):
+        return item_id in self.items
+
+    def __len__(self):
+        return len(self.items)
+
+    def add_item(self, item_id, item):
+        """Add or replace an item (item needs 'type' and an integer 'cost')"""
+        if item_id in self.items:
+            self._delete(item_id)
+        self._insert(item_id, item)
+        self._lines.clear()
+
+    def remove_item(self, item_id):
+        """Raises: ItemNotFoundError if the item is not in the catalog"""
+        if item_id not in self.items:
+            raise ItemNotFoundError(f"{item_id} is not sold here")
+        self._delete(item_id)
+        self._lines.clear()
+
+    def query(self, item_type=None, min_cost=None, max_cost=None, page=1, page_size=PAGE_SIZE):
+        """
+        Return one page of items, cheapest first
+
+        Args:
+            item_type: Only items of this type (None = every type)
+            min_cost, max_cost: Inclusive price band (None = unbounded)
+            page: 1-based page number
+
+        Returns: List of (item_id, item) pairs
+        Raises: ValueError if page or page_size is below 1
+        """
+        keys, low, high = self._range(item_type, min_cost, max_cost)
+        start, end = self._page_bounds(low, high, page, page_size)
+        return [(item_id, self.items[item_id]) for cost, item_id in keys[start:end]]
+
+    def count(self, item_type=None, min_cost=None, max_cost=None):
+        """Return how many items a query would match over all pages"""
+        keys, low, high = self._range(item_type, min_cost, max_cost)
+        return high - low
+
+    def affordable(self, gold, item_type=None, page=1, page_size=PAGE_SIZE):
+        """Return a page of the items that cost at most gold"""
+        return self.query(item_type, max_cost=gold, page=page, page_size=page_size)
+
+    def render(self, item_type=None, min_cost=None, max_cost=None, page=1, page_size=PAGE_SIZE):
+        """
+        Return a page of the listing as text
+
+        Returns: One "item_id: type - Cost: N" line per item, followed by a
+                 "Page X of Y" line
+        Raises: ValueError if page or page_size is below 1
+        """
+        lines = self._lines.get(item_type)
+        if lines is None:
+            # Parallel to self._index[item_type], so a price band is a slice
+            lines = [
+                f"{item_id}: {self.items[item_id]['type']} - Cost: {self.items[item_id]['cost']}"
+                for cost, item_id in self._index.get(item_type, [])
+            ]
+            self._lines[item_type] = lines
+        keys, low, high = self._range(item_type, min_cost, max_cost)
+        start, end = self._page_bounds(low, high, page, page_size)
+        pages = max(1, -(-(high - low) // page_size))
+        return "\n".join(lines[start:end] + [f"Page {page} of {pages}"])
+
+    def _range(self, item_type, min_cost, max_cost):
+        keys = self._index.get(item_type, [])
+        low = 0 if min_cost is None else bisect.bisect_left(keys, (min_cost,))
+        high = len(keys) if max_cost is None else bisect.bisect_left(keys, (max_cost + 1,))
+        return keys, low, max(low, high)
+
+    def _page_bounds(self, low, high, page, page_size):
+        # A page below 1 would slice outside the [low, high) band
+        if page < 1 or page_size < 1:
+            raise ValueError(f"Invalid page {page!r} of size {page_size!r}")
+        start = low + (page - 1) * page_size
+        return start, min(high, start + page_size)
+
+    def _insert(self, item_id, item):
+        self.items[item_id] = item
+        key = (int(item['cost']), item_id)
+        bisect.insort(self._index[None], key)
+        bisect.insort(self._index.setdefault(item['type'], []), key)
+
+    def _delete(self, item_id):
+        item = self.items.pop(item_id)
+        key = (int(item['cost']), item_id)
+        for keys in (self._index[None], self._index[item['type']]):
+            del keys[bisect.bisect_left(keys, key)]
+
 def display_inventory(character, item_data_dict):
     """
     Display character's inventory in formatted way
@@ -341,10 +777,15 @@ def display_inventory(character, item_data_dict):
     # TODO: Implement inventory display
     # Count items (some may appear multiple times)
     # Display with item names from item_data_dict
-    counts = {}
-    for item in character['inventory']:
-        counts[item] = counts.get(item, 0) + 1
-    for item_id, count in counts.items():
+    inventory = character['inventory']
+    if isinstance(inventory, Inventory):
+        counts = inventory.items()
+    else:
+        counts = {}
+        for item in inventory:
+            counts[item] = counts.get(item, 0) + 1
+        counts = counts.items()
+    for item_id, count in counts:
         name = item_data_dict[item_id]['name'] if item_id in item_data_dict else item_id
         item_type = item_data_dict[item_id]['type'] if item_id in item_data_dict else "unknown"
         print(f"{name} (x{count}) - {item_type}")
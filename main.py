@@ -7,6 +7,9 @@ Name: Silas Hayes
 AI Usage: Assisted with any indentation or syntax errors that I orignially did not notice.
 """
 
+import inspect
+import random
+
 # Import all our custom modules
 import character_manager
 import inventory_system
@@ -22,6 +25,8 @@ from custom_exceptions import *
 current_character = None
 all_quests = {}
 all_items = {}
+quest_index = None
+shop_catalog = None
 game_running = False
 
 # ============================================================================
@@ -59,13 +64,18 @@ def new_game():
 def load_game():
     """Load an existing saved game"""
     global current_character
-    saved_characters = character_manager.list_saved_characters()
+    summaries = character_manager.get_save_summaries()
+    saved_characters = list(summaries)
     if not saved_characters:
         print("No saved characters found. Start a new game.")
         return
     print("\nSaved Characters:")
     for i, char_name in enumerate(saved_characters, 1):
-        print(f"{i}. {char_name}")
+        summary = summaries[char_name]
+        if summary["class"] is None:
+            print(f"{i}. {char_name}")
+        else:
+            print(f"{i}. {char_name} - Level {summary['level']} {summary['class']}")
     while True:
         choice = input(f"Select a character (1-{len(saved_characters)}): ").strip()
         if choice.isdigit() and 1 <= int(choice) <= len(saved_characters):
@@ -88,6 +98,8 @@ def game_loop():
     """Main game loop"""
     global game_running
     game_running = True
+    if quest_index is not None:
+        quest_handler.track_available_quests(current_character, quest_index)
     while game_running:
         choice = game_menu()
         if choice == 1:
@@ -183,7 +195,7 @@ def quest_menu():
                 active = quest_handler.get_active_quests(current_character, all_quests)
                 quest_handler.display_quest_list(active)
             elif choice == '2':
-                available = quest_handler.get_available_quests(current_character, all_quests)
+                available = quest_handler.get_available_quests(current_character, all_quests, quest_index)
                 quest_handler.display_quest_list(available)
             elif choice == '3':
                 completed = quest_handler.get_completed_quests(current_character, all_quests)
@@ -210,10 +222,10 @@ def quest_menu():
 def explore():
     """Find and fight random enemies"""
     global current_character
-    enemy = combat_system.generate_random_enemy(current_character['level'])
+    enemy = combat_system.get_random_enemy_for_level(current_character['level'])
     print(f"Encountered {enemy['name']}!")
     try:
-        result = combat_system.SimpleBattle(current_character, enemy)
+        result = combat_system.SimpleBattle(current_character, enemy).start_battle()
         print(f"Battle Result: {result}")
         if current_character['health'] <= 0:
             handle_character_death()
@@ -222,16 +234,25 @@ def explore():
 
 def shop():
     """Shop menu for buying/selling items"""
-    global current_character, all_items
+    global current_character, all_items, shop_catalog
+    if shop_catalog is None:
+        shop_catalog = inventory_system.ShopCatalog(all_items)
+    page = 1
+    affordable_only = False
     while True:
         print(f"Gold: {current_character['gold']}")
         print("Available items:")
-        for item_id, data in all_items.items():
-            print(f"{item_id}: {data['type']} - Cost: {data.get('cost',0)}")
+        max_cost = current_character['gold'] if affordable_only else None
+        pages = max(1, -(-shop_catalog.count(max_cost=max_cost) // shop_catalog.PAGE_SIZE))
+        page = min(page, pages)
+        print(shop_catalog.render(max_cost=max_cost, page=page))
         print("Options:")
         print("1. Buy Item")
         print("2. Sell Item")
         print("3. Back")
+        print("4. Next Page")
+        print("5. Previous Page")
+        print("6. Toggle Affordable Items Only")
         choice = input("Enter choice: ").strip()
         try:
             if choice == '1':
@@ -243,6 +264,13 @@ def shop():
                 print(f"Sold for {gold_received} gold.")
             elif choice == '3':
                 break
+            elif choice == '4':
+                page = page + 1 if page < pages else 1
+            elif choice == '5':
+                page = page - 1 if page > 1 else pages
+            elif choice == '6':
+                affordable_only = not affordable_only
+                page = 1
             else:
                 print("Invalid choice.")
         except (InventoryFullError, InsufficientResourcesError, ItemNotFoundError) as e:
@@ -263,18 +291,24 @@ def save_game():
 
 def load_game_data():
     """Load all quest and item data from files"""
-    global all_quests, all_items
+    global all_quests, all_items, quest_index, shop_catalog
     try:
         all_quests = game_data.load_quests()
         all_items = game_data.load_items()
+        game_data.get_class_table()
+        game_data.get_enemy_table()
     except MissingDataFileError:
         print("Game data files missing. Creating defaults...")
         game_data.create_default_data_files()
         all_quests = game_data.load_quests()
         all_items = game_data.load_items()
+        game_data.get_class_table()
+        game_data.get_enemy_table()
     except InvalidDataFormatError as e:
         print(f"Invalid data format: {e}")
         raise
+    quest_index = quest_handler.QuestIndex(all_quests)
+    shop_catalog = inventory_system.ShopCatalog(all_items)
 
 def handle_character_death():
     """Handle character death"""
@@ -305,6 +339,246 @@ def display_welcome():
     print("Build your character, complete quests, and become a legend!")
     print()
 
+# ============================================================================
+# SCRIPTED SESSIONS
+# ============================================================================
+
+class GameSession:
+    """
+    Game state plus a command API for driving the game without input()
+
+    Holds what the menus keep in module globals (the current character,
+    quests, items and their indexes) so several sessions can run side by
+    side. execute() calls the same module functions the menus do, but
+    returns results instead of printing them. Game errors are raised as
+    the usual custom exceptions. Battles are headless: the player's action
+    each turn comes from the explore command, and battle seeds come from
+    the session's seed so a replayed script fights the same battles.
+
+    Example:
+        session = GameSession.from_data_files(seed=1)
+        session.execute("new", "Ayla", "Warrior")
+        session.execute("buy", "health_potion", 3)
+        session.execute("explore", "attack")
+    """
+
+    def __init__(self, quests, items, save_directory="data/save_games", seed=None, log=None):
+        """
+        Args:
+            quests, items: Output of game_data.load_quests / load_items
+            save_directory: Where save and load read and write characters
+            seed: Seed for the battle seeds (None = unpredictable)
+            log: Optional callable receiving battle log lines
+        """
+        self.quests = quests
+        self.items = items
+        self.quest_index = quest_handler.QuestIndex(quests)
+        self.shop_catalog = inventory_system.ShopCatalog(items)
+        self.save_directory = save_directory
+        self.rng = random.Random(seed)
+        self.log = log
+        self.character = None
+        self._commands = {
+            "new": self.new_character,
+            "load": self.load_character,
+            "save": self.save,
+            "stats": self.stats,
+            "inventory": self.inventory,
+            "use": self.use_item,
+            "equip_weapon": self.equip_weapon,
+            "equip_armor": self.equip_armor,
+            "unequip_weapon": self.unequip_weapon,
+            "unequip_armor": self.unequip_armor,
+            "drop": self.drop_item,
+            "shop": self.shop,
+            "buy": self.buy,
+            "sell": self.sell,
+            "quests": self.list_quests,
+            "accept": self.accept_quest,
+            "abandon": self.abandon_quest,
+            "complete": self.complete_quest,
+            "explore": self.explore,
+            "revive": self.revive
+        }
+
+    @classmethod
+    def from_data_files(cls, quests_file="data/quests.txt", items_file="data/items.txt", **kwargs):
+        return cls(game_data.load_quests(quests_file), game_data.load_items(items_file), **kwargs)
+
+    @property
+    def commands(self):
+        return sorted(self._commands)
+
+    def execute(self, command, *args):
+        """
+        Run one command and return its result
+
+        Raises: ValueError for an unknown command or the wrong number of
+                arguments, otherwise whatever the underlying game function
+                raises
+        """
+        handler = self._commands.get(command)
+        if handler is None:
+            raise ValueError(f"Unknown command: {command}")
+        try:
+            inspect.signature(handler).bind(*args)
+        except TypeError as e:
+            raise ValueError(f"Bad arguments for {command}: {e}") from None
+        return handler(*args)
+
+    def run_script(self, script):
+        """
+        Run a list of commands, for example a recorded play session
+
+        Each command is a string ("buy health_potion 3") or a sequence
+        (("buy", "health_potion", 3)). A failing command does not stop the
+        script.
+
+        Returns: List with each command's result, or the exception it raised
+        """
+        results = []
+        for line in script:
+            try:
+                command, *args = line.split() if isinstance(line, str) else line
+                results.append(self.execute(command, *args))
+            except (GameError, ValueError) as e:
+                results.append(e)
+        return results
+
+    # Character commands
+
+    def new_character(self, name, character_class):
+        self._set_character(character_manager.create_character(name, character_class))
+        return self.stats()
+
+    def load_character(self, name):
+        self._set_character(character_manager.load_character(name, self.save_directory))
+        return self.stats()
+
+    def save(self):
+        return character_manager.save_character(self._require_character(), self.save_directory)
+
+    def stats(self):
+        """Return the character's saved fields (no runtime state)"""
+        character = self._require_character()
+        return {key: value for key, value in character.items() if not key.startswith("_")}
+
+    def revive(self):
+        return character_manager.revive_character(self._require_character())
+
+    # Inventory commands
+
+    def inventory(self):
+        """Return (item_id, quantity) pairs"""
+        inventory = self._require_character()['inventory']
+        if isinstance(inventory, inventory_system.Inventory):
+            return list(inventory.items())
+        counts = {}
+        for item_id in inventory:
+            counts[item_id] = counts.get(item_id, 0) + 1
+        return list(counts.items())
+
+    def use_item(self, item_id):
+        return inventory_system.use_item(self._require_character(), item_id, self._item(item_id))
+
+    def equip_weapon(self, item_id):
+        return inventory_system.equip_weapon(self._require_character(), item_id, self._item(item_id))
+
+    def equip_armor(self, item_id):
+        return inventory_system.equip_armor(self._require_character(), item_id, self._item(item_id))
+
+    def unequip_weapon(self):
+        return inventory_system.unequip_weapon(self._require_character())
+
+    def unequip_armor(self):
+        return inventory_system.unequip_armor(self._require_character())
+
+    def drop_item(self, item_id):
+        return inventory_system.remove_item_from_inventory(self._require_character(), item_id)
+
+    # Shop commands
+
+    def shop(self, item_type=None, page=1, affordable=False):
+        """Return one page of (item_id, item) listings"""
+        max_cost = self._require_character()['gold'] if _parse_flag(affordable) else None
+        return self.shop_catalog.query(item_type, max_cost=max_cost, page=int(page))
+
+    def buy(self, item_id, quantity=1):
+        return inventory_system.purchase_items(self._require_character(),
+                                               [(item_id, int(quantity))], self.items)
+
+    def sell(self, item_id, quantity=1):
+        return inventory_system.sell_items(self._require_character(),
+                                           [(item_id, int(quantity))], self.items)
+
+    # Quest commands
+
+    def list_quests(self, kind="available"):
+        """Return the IDs of the active, available or completed quests"""
+        character = self._require_character()
+        if kind == "active":
+            quests = quest_handler.get_active_quests(character, self.quests)
+        elif kind == "completed":
+            quests = quest_handler.get_completed_quests(character, self.quests)
+        elif kind == "available":
+            quests = quest_handler.get_available_quests(character, self.quests, self.quest_index)
+        else:
+            raise ValueError(f"Unknown quest list: {kind}")
+        return [quest['quest_id'] for quest in quests]
+
+    def accept_quest(self, quest_id):
+        return quest_handler.accept_quest(self._require_character(), quest_id, self.quests)
+
+    def abandon_quest(self, quest_id):
+        return quest_handler.abandon_quest(self._require_character(), quest_id)
+
+    def complete_quest(self, quest_id):
+        return quest_handler.complete_quest(self._require_character(), quest_id, self.quests)
+
+    # Combat commands
+
+    def explore(self, *actions):
+        """
+        Fight an enemy chosen for the character's level
+
+        Args:
+            actions: Actions to play in order ("attack", "special", "run");
+                     once they run out every turn attacks
+
+        Returns: The battle result, plus the enemy type and battle seed
+        """
+        character = self._require_character()
+        enemy = combat_system.get_random_enemy_for_level(character['level'])
+        seed = self.rng.getrandbits(64)
+        result = combat_system.run_headless_battle(character, enemy, list(actions),
+                                                   log=self.log, seed=seed)
+        return dict(result, enemy=enemy['name'], seed=seed)
+
+    def _set_character(self, character):
+        self.character = character
+        quest_handler.track_available_quests(character, self.quest_index)
+
+    def _require_character(self):
+        if self.character is None:
+            raise CharacterNotFoundError("No character loaded")
+        return self.character
+
+    def _item(self, item_id):
+        if item_id not in self.items:
+            raise ItemNotFoundError(f"Unknown item: {item_id}")
+        return self.items[item_id]
+
+def _parse_flag(value):
+    """Turn a script argument such as "true" or "no" into a bool"""
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ("true", "yes", "1"):
+        return True
+    if text in ("false", "no", "0"):
+        return False
+    raise ValueError(f"Expected true or false, got {value!r}")
+
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
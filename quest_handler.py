@@ -18,6 +18,7 @@ from custom_exceptions import (
 )
 
 import character_manager
+from bisect import bisect_left, bisect_right
 
 # ============================================================================
 # QUEST MANAGEMENT
@@ -80,6 +81,10 @@ def accept_quest(character, quest_id, quest_data_dict):
         return False
 
     character["active_quests"].append(quest_id)
+    character_manager.mark_dirty(character)
+    tracker = character.get("_available_quests")
+    if tracker is not None:
+        tracker.quest_accepted(quest_id)
     return True
 
 def complete_quest(character, quest_id, quest_data_dict):
@@ -122,6 +127,10 @@ def complete_quest(character, quest_id, quest_data_dict):
     character["active_quests"].remove(quest_id)
     if quest_id not in character["completed_quests"]:
         character["completed_quests"].append(quest_id)
+    character_manager.mark_dirty(character)
+    tracker = character.get("_available_quests")
+    if tracker is not None:
+        tracker.quest_completed(character, quest_id)
 
     # Grant rewards
     xp = int(quest.get("reward_xp", 0))
@@ -155,6 +164,10 @@ def abandon_quest(character, quest_id):
         raise QuestNotActiveError(f"Quest '{quest_id}' is not active.")
 
     character["active_quests"].remove(quest_id)
+    character_manager.mark_dirty(character)
+    tracker = character.get("_available_quests")
+    if tracker is not None:
+        tracker.quest_abandoned(character, quest_id)
     return True
 
 def get_active_quests(character, quest_data_dict):
@@ -187,16 +200,26 @@ def get_completed_quests(character, quest_data_dict):
             result.append(quest_data_dict[qid])
     return result
 
-def get_available_quests(character, quest_data_dict):
+def get_available_quests(character, quest_data_dict, quest_index=None):
     """
     Get quests that character can currently accept
     
     Available = meets level req + prerequisite done + not completed + not active
+
+    If a QuestIndex built from quest_data_dict is passed, only the quests
+    unlocked by the character's completed quests are looked at. If the
+    character is tracked with track_available_quests, the tracked set is
+    returned directly.
     
     Returns: List of quest dictionaries
     """
     # TODO: Implement available quest search
     # Filter all quests by requirements
+    tracker = character.get("_available_quests")
+    if tracker is not None and tracker.index.quests is quest_data_dict:
+        return tracker.available_quests()
+    if quest_index is not None:
+        return quest_index.available_quests(character)
     character.setdefault("active_quests", [])
     character.setdefault("completed_quests", [])
     available = []
@@ -268,7 +291,7 @@ def can_accept_quest(character, quest_id, quest_data_dict):
 
     return True
 
-def get_quest_prerequisite_chain(quest_id, quest_data_dict):
+def get_quest_prerequisite_chain(quest_id, quest_data_dict, quest_index=None):
     """
     Get the full chain of prerequisites for a quest
     
@@ -281,6 +304,8 @@ def get_quest_prerequisite_chain(quest_id, quest_data_dict):
     # TODO: Implement prerequisite chain tracing
     # Follow prerequisite links backwards
     # Build list in reverse order
+    if quest_index is not None:
+        return quest_index.prerequisite_chain(quest_id)
     if quest_id not in quest_data_dict:
         raise QuestNotFoundError(f"Quest '{quest_id}' not found.")
 
@@ -341,13 +366,15 @@ def get_total_quest_rewards_earned(character, quest_data_dict):
             total_gold += int(q.get("reward_gold", 0))
     return {"total_xp": total_xp, "total_gold": total_gold}
 
-def get_quests_by_level(quest_data_dict, min_level, max_level):
+def get_quests_by_level(quest_data_dict, min_level, max_level, quest_index=None):
     """
     Get all quests within a level range
     
     Returns: List of quest dictionaries
     """
     # TODO: Implement level filtering
+    if quest_index is not None:
+        return quest_index.quests_by_level(min_level, max_level)
     result = []
     for qid, q in quest_data_dict.items():
         req = int(q.get("required_level", 1))
@@ -355,6 +382,230 @@ def get_quests_by_level(quest_data_dict, min_level, max_level):
             result.append(q)
     return result
 
+# ============================================================================
+# QUEST INDEX
+# ============================================================================
+
+class QuestIndex:
+    """
+    Precomputed lookups over a loaded quest dictionary
+
+    Build it once after game_data.load_quests and pass it to
+    get_available_quests, get_quest_prerequisite_chain and
+    get_quests_by_level. The index does not notice later changes to
+    quest_data_dict, so rebuild it if the quests are reloaded.
+
+    Attributes:
+        quests: The quest dictionary the index was built from
+        children: Prerequisite quest ID -> quest IDs it unlocks
+        depth: Quest ID -> number of prerequisites above it
+               (None if its chain is broken or circular)
+        level_buckets: Required level -> quest IDs at that level
+        required_levels: Quest ID -> required level
+        sorted_levels: Every required level that has quests, ascending
+    """
+
+    def __init__(self, quest_data_dict):
+        self.quests = quest_data_dict
+        self.order = {}
+        self.children = {}
+        self.level_buckets = {}
+        self.required_levels = {}
+        self._root_ids = []
+        self._chains = {}
+
+        for position, (qid, quest) in enumerate(quest_data_dict.items()):
+            self.order[qid] = position
+            level = int(quest.get("required_level", 1))
+            self.required_levels[qid] = level
+            self.level_buckets.setdefault(level, []).append(qid)
+            prereq = quest.get("prerequisite", "NONE")
+            if not prereq or prereq == "NONE":
+                self._root_ids.append(qid)
+            else:
+                self.children.setdefault(prereq, []).append(qid)
+
+        # Quests without a prerequisite, sorted by level so a character's
+        # unlocked roots are a prefix of the list
+        self._root_ids.sort(key=lambda qid: self.required_levels[qid])
+        self._root_levels = [self.required_levels[qid] for qid in self._root_ids]
+        self.sorted_levels = sorted(self.level_buckets)
+
+        self.depth = {}
+        for qid in quest_data_dict:
+            self.depth[qid] = self._compute_depth(qid)
+
+    def _compute_depth(self, quest_id):
+        path = []
+        seen = set()
+        current = quest_id
+        while current not in self.depth:
+            if current in seen or current not in self.quests:
+                # circular or missing prerequisite
+                for qid in path:
+                    self.depth[qid] = None
+                return None
+            path.append(current)
+            seen.add(current)
+            prereq = self.quests[current].get("prerequisite", "NONE")
+            if not prereq or prereq == "NONE":
+                self.depth[path.pop()] = 0
+                break
+            current = prereq
+
+        base = self.depth[current]
+        for qid in reversed(path):
+            base = None if base is None else base + 1
+            self.depth[qid] = base
+        return self.depth[quest_id]
+
+    def available_quests(self, character):
+        """
+        Get quests the character can accept right now
+
+        Only root quests up to the character's level and the quests unlocked
+        by each completed quest are examined.
+
+        Returns: List of quest dictionaries in quest file order
+        """
+        character.setdefault("active_quests", [])
+        character.setdefault("completed_quests", [])
+        completed = _as_set(character["completed_quests"])
+        active = _as_set(character["active_quests"])
+        level = character.get("level", 1)
+
+        candidates = self._root_ids[:bisect_right(self._root_levels, level)]
+        for qid in completed:
+            for child in self.children.get(qid, ()):
+                if self.required_levels[child] <= level:
+                    candidates.append(child)
+
+        available = [
+            qid for qid in candidates
+            if qid not in completed and qid not in active
+        ]
+        available.sort(key=self.order.__getitem__)
+        return [self.quests[qid] for qid in available]
+
+    def prerequisite_chain(self, quest_id):
+        """
+        Memoized get_quest_prerequisite_chain
+
+        Returns: List of quest IDs [earliest_prereq, ..., quest_id]
+        Raises: QuestNotFoundError if the quest or a prerequisite is missing
+        """
+        if quest_id in self._chains:
+            return list(self._chains[quest_id])
+        if self.depth.get(quest_id) is None:
+            # Unknown quest, missing prerequisite or circular chain: let the
+            # plain walk raise or stop exactly as it always has
+            return get_quest_prerequisite_chain(quest_id, self.quests)
+
+        path = []
+        current = quest_id
+        while current not in self._chains and self.depth[current] > 0:
+            path.append(current)
+            current = self.quests[current]["prerequisite"]
+        if current not in self._chains:
+            self._chains[current] = (current,)
+
+        chain = self._chains[current]
+        for qid in reversed(path):
+            chain = chain + (qid,)
+            self._chains[qid] = chain
+        return list(chain)
+
+    def quests_by_level(self, min_level, max_level):
+        """
+        Get all quests whose required level is within [min_level, max_level]
+
+        Returns: List of quest dictionaries in quest file order
+        """
+        start = bisect_left(self.sorted_levels, min_level)
+        end = bisect_right(self.sorted_levels, max_level)
+        found = []
+        for level in self.sorted_levels[start:end]:
+            found.extend(self.level_buckets[level])
+        found.sort(key=self.order.__getitem__)
+        return [self.quests[qid] for qid in found]
+
+def _as_set(quest_ids):
+    """Return quest_ids if it already has O(1) membership, else a set copy"""
+    if isinstance(quest_ids, (set, character_manager.OrderedIdSet)):
+        return quest_ids
+    return set(quest_ids)
+
+def track_available_quests(character, quest_index):
+    """
+    Start keeping the character's available quests up to date
+
+    accept_quest, complete_quest, abandon_quest and
+    character_manager.gain_experience update the tracked set in place, so
+    get_available_quests no longer scans anything. Changes made by
+    editing the quest lists directly are not seen; call this again to
+    resynchronize.
+
+    Returns: The AvailableQuestTracker stored on the character
+    """
+    tracker = AvailableQuestTracker(character, quest_index)
+    character["_available_quests"] = tracker
+    return tracker
+
+class AvailableQuestTracker:
+    """
+    Per-character set of quest IDs that can be accepted right now
+
+    Stored under the character's "_available_quests" key; keys that start
+    with an underscore are runtime state and are never saved.
+    """
+
+    def __init__(self, character, quest_index):
+        self.index = quest_index
+        self.available = {
+            quest["quest_id"] for quest in quest_index.available_quests(character)
+        }
+
+    def available_quests(self):
+        """Return the tracked quests in quest file order"""
+        order = self.index.order
+        return [self.index.quests[qid] for qid in sorted(self.available, key=order.__getitem__)]
+
+    def _unlocked(self, character, quest_id, completed):
+        quest = self.index.quests[quest_id]
+        prereq = quest.get("prerequisite", "NONE")
+        return (
+            self.index.required_levels[quest_id] <= character.get("level", 1)
+            and (not prereq or prereq == "NONE" or prereq in completed)
+            and quest_id not in completed
+            and quest_id not in character["active_quests"]
+        )
+
+    def quest_accepted(self, quest_id):
+        self.available.discard(quest_id)
+
+    def quest_abandoned(self, character, quest_id):
+        if quest_id in self.index.quests and self._unlocked(
+                character, quest_id, character["completed_quests"]):
+            self.available.add(quest_id)
+
+    def quest_completed(self, character, quest_id):
+        self.available.discard(quest_id)
+        completed = character["completed_quests"]
+        for child in self.index.children.get(quest_id, ()):
+            if self._unlocked(character, child, completed):
+                self.available.add(child)
+
+    def level_changed(self, character, old_level):
+        """Add quests whose required level is in (old_level, new level]"""
+        levels = self.index.sorted_levels
+        start = bisect_right(levels, old_level)
+        end = bisect_right(levels, character.get("level", 1))
+        completed = _as_set(character["completed_quests"])
+        for level in levels[start:end]:
+            for qid in self.index.level_buckets[level]:
+                if self._unlocked(character, qid, completed):
+                    self.available.add(qid)
+
 # ============================================================================
 # DISPLAY FUNCTIONS
 # ============================================================================
@@ -0,0 +1,466 @@
+"""
+Test Character State
+Tests the containers and bookkeeping that live on the character dictionary
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+import quest_handler
+import game_data
+from custom_exceptions import (
+    InventoryFullError,
+    ItemNotFoundError,
+    InvalidDataFormatError,
+    InsufficientResourcesError
+)
+
+# ============================================================================
+# QUEST STATE TESTS
+# ============================================================================
+
+def test_ordered_id_set_behaves_like_quest_list():
+    """Test the list operations the quest functions rely on"""
+    ids = character_manager.OrderedIdSet(["b", "a"])
+    ids.append("c")
+    ids.append("a")
+
+    assert list(ids) == ["b", "a", "c"]
+    assert "a" in ids and "z" not in ids
+    assert len(ids) == 3
+    assert ids == ["b", "a", "c"]
+
+    ids.remove("a")
+    assert list(ids) == ["b", "c"]
+    with pytest.raises(ValueError):
+        ids.remove("a")
+
+def test_quest_functions_run_on_set_backed_state():
+    """Test quest actions on a freshly created character"""
+    char = character_manager.create_character("SetTest", "Cleric")
+    quests = {
+        'a': {'quest_id': 'a', 'reward_xp': 10, 'reward_gold': 5,
+              'required_level': 1, 'prerequisite': 'NONE'},
+        'b': {'quest_id': 'b', 'reward_xp': 10, 'reward_gold': 5,
+              'required_level': 1, 'prerequisite': 'a'}
+    }
+
+    quest_handler.accept_quest(char, 'a', quests)
+    assert quest_handler.is_quest_active(char, 'a')
+    quest_handler.complete_quest(char, 'a', quests)
+    assert quest_handler.is_quest_completed(char, 'a')
+    assert quest_handler.can_accept_quest(char, 'b', quests)
+    quest_handler.accept_quest(char, 'b', quests)
+    quest_handler.abandon_quest(char, 'b')
+
+    assert isinstance(char['completed_quests'], character_manager.OrderedIdSet)
+    assert list(char['active_quests']) == []
+
+def test_quest_order_survives_save_and_load(tmp_path):
+    """Test that insertion order is kept in save files"""
+    char = character_manager.create_character("OrderTest", "Warrior")
+    for qid in ["zeta", "alpha", "mid"]:
+        char['completed_quests'].append(qid)
+
+    character_manager.save_character(char, str(tmp_path))
+    loaded = character_manager.load_character("OrderTest", str(tmp_path))
+
+    assert list(loaded['completed_quests']) == ["zeta", "alpha", "mid"]
+    assert character_manager.validate_character_data(loaded)
+
+# ============================================================================
+# INVENTORY TESTS
+# ============================================================================
+
+def test_inventory_counts_and_total():
+    """Test O(1) counting and the running total"""
+    inventory = inventory_system.Inventory(["potion", "sword", "potion"])
+
+    assert len(inventory) == 3
+    assert inventory.count("potion") == 2
+    assert inventory.count("shield") == 0
+    assert list(inventory) == ["potion", "potion", "sword"]
+
+    inventory.remove("potion")
+    inventory.remove("potion")
+    assert "potion" not in inventory
+    assert len(inventory) == 1
+    with pytest.raises(ValueError):
+        inventory.remove("potion")
+
+@pytest.mark.parametrize("quantity", [0, -2])
+def test_inventory_rejects_bad_quantities(quantity):
+    """Test that add and remove only accept positive quantities"""
+    inventory = inventory_system.Inventory(["x"])
+
+    with pytest.raises(ValueError):
+        inventory.add("y", quantity)
+    with pytest.raises(ValueError):
+        inventory.remove("x", quantity)
+
+    assert "y" not in inventory
+    assert list(inventory) == ["x"]
+
+def test_inventory_functions_on_counter_inventory():
+    """Test the module functions against the Inventory type"""
+    char = character_manager.create_character("CounterTest", "Rogue")
+    for _ in range(inventory_system.MAX_INVENTORY_SIZE):
+        inventory_system.add_item_to_inventory(char, "health_potion")
+
+    assert inventory_system.count_item(char, "health_potion") == inventory_system.MAX_INVENTORY_SIZE
+    assert inventory_system.get_inventory_space_remaining(char) == 0
+    with pytest.raises(InventoryFullError):
+        inventory_system.add_item_to_inventory(char, "iron_sword")
+
+    inventory_system.remove_item_from_inventory(char, "health_potion")
+    assert inventory_system.has_item(char, "health_potion")
+    with pytest.raises(ItemNotFoundError):
+        inventory_system.remove_item_from_inventory(char, "iron_sword")
+
+    removed = inventory_system.clear_inventory(char)
+    assert removed == ["health_potion"] * (inventory_system.MAX_INVENTORY_SIZE - 1)
+    assert len(char['inventory']) == 0
+
+def test_inventory_save_format_unchanged(tmp_path):
+    """Test that the inventory is still saved as comma-separated IDs"""
+    char = character_manager.create_character("FormatTest", "Mage")
+    for item_id in ["potion", "staff", "potion"]:
+        inventory_system.add_item_to_inventory(char, item_id)
+
+    character_manager.save_character(char, str(tmp_path))
+    with open(tmp_path / "FormatTest_save.txt") as f:
+        assert "INVENTORY: potion,potion,staff\n" in f.read()
+
+    loaded = character_manager.load_character("FormatTest", str(tmp_path))
+    assert loaded['inventory'].count("potion") == 2
+
+# ============================================================================
+# LEVEL UP TESTS
+# ============================================================================
+
+def level_up_one_at_a_time(character, xp_amount):
+    character["experience"] += xp_amount
+    while character["experience"] >= character["level"] * 100:
+        character["experience"] -= character["level"] * 100
+        character["level"] += 1
+        character["max_health"] += 10
+        character["strength"] += 2
+        character["magic"] += 2
+        character["health"] = character["max_health"]
+
+@pytest.mark.parametrize("level", [1, 2, 7, 150, 199, 200, 201])
+@pytest.mark.parametrize("xp_amount", [-50, 0, 1, 99, 100, 250, 5000, 10**6, 10**8])
+def test_gain_experience_matches_level_loop(level, xp_amount):
+    """Test that the closed form gives the same stats as levelling one by one"""
+    char = character_manager.create_character("Leveler", "Warrior")
+    char['level'] = level
+    char['experience'] = level * 37 % (level * 100)
+    char['health'] = 5
+    expected = dict(char)
+    level_up_one_at_a_time(expected, xp_amount)
+
+    character_manager.gain_experience(char, xp_amount)
+
+    for field in ["level", "experience", "max_health", "strength", "magic", "health"]:
+        assert char[field] == expected[field]
+
+@pytest.mark.parametrize("xp_amount", [0.5, 99.5, 150.0, 1234.25])
+def test_gain_experience_accepts_float_xp(xp_amount):
+    """Test that float experience levels up like the one-by-one loop"""
+    char = character_manager.create_character("Floaty", "Mage")
+    expected = dict(char)
+    level_up_one_at_a_time(expected, xp_amount)
+
+    character_manager.gain_experience(char, xp_amount)
+
+    assert (char['level'], char['experience']) == (expected['level'], expected['experience'])
+
+# ============================================================================
+# ITEM EFFECT TESTS
+# ============================================================================
+
+def test_item_effects_parsed_at_load():
+    """Test that load_items stores structured modifiers"""
+    items = game_data.load_items("data/items.txt", use_cache=False)
+
+    assert items["health_potion"]["modifiers"] == (("health", 20),)
+    assert game_data.parse_item_modifiers("strength:3, magic:-2") == (("strength", 3), ("magic", -2))
+    with pytest.raises(InvalidDataFormatError):
+        game_data.parse_item_modifiers("strength")
+
+def test_equipment_uses_modifiers_without_reparsing(monkeypatch):
+    """Test equip and unequip with pre-parsed, multi-stat items"""
+    items = {
+        "rune_blade": {"name": "Rune Blade", "type": "weapon", "effect": "strength:4,magic:3",
+                       "modifiers": (("strength", 4), ("magic", 3))},
+        "iron_sword": {"name": "Iron Sword", "type": "weapon", "effect": "strength:5",
+                       "modifiers": (("strength", 5),)},
+        "chainmail": {"name": "Chainmail", "type": "armor", "effect": "max_health:15",
+                      "modifiers": (("max_health", 15),)}
+    }
+
+    def fail(effect):
+        raise AssertionError("effects should not be parsed again")
+
+    monkeypatch.setattr(game_data, "parse_item_modifiers", fail)
+    monkeypatch.setattr(inventory_system, "parse_item_effect", fail)
+    char = character_manager.create_character("Gear", "Mage")
+    base = (char['strength'], char['magic'], char['max_health'])
+    for item_id in items:
+        inventory_system.add_item_to_inventory(char, item_id)
+
+    inventory_system.equip_weapon(char, "rune_blade", items["rune_blade"])
+    inventory_system.equip_armor(char, "chainmail", items["chainmail"])
+    assert (char['strength'], char['magic'], char['max_health']) == (base[0] + 4, base[1] + 3, base[2] + 15)
+    assert char['equipped_armor'] == "chainmail"
+
+    inventory_system.equip_weapon(char, "iron_sword", items["iron_sword"])
+    assert (char['strength'], char['magic']) == (base[0] + 5, base[1])
+    assert "rune_blade" in char['inventory']
+
+    inventory_system.unequip_weapon(char)
+    inventory_system.unequip_armor(char)
+    assert (char['strength'], char['magic'], char['max_health']) == base
+    assert char['stat_modifiers'] == {}
+
+@pytest.mark.parametrize("save_format", ["text", "binary"])
+def test_equipment_survives_save_and_load(tmp_path, save_format):
+    """Test that equipped items can be unequipped after a reload"""
+    char = character_manager.create_character("Saved", "Warrior")
+    base_strength = char['strength']
+    inventory_system.add_item_to_inventory(char, "iron_sword")
+    inventory_system.equip_weapon(char, "iron_sword", {"type": "weapon", "effect": "strength:5"})
+    char['equipped_armor'] = None
+
+    character_manager.save_character(char, str(tmp_path), save_format=save_format)
+    loaded = character_manager.load_character("Saved", str(tmp_path))
+
+    assert loaded['equipped_armor'] is None
+    assert loaded['stat_modifiers'] == {"weapon": (("strength", 5),)}
+    assert inventory_system.unequip_armor(loaded) is None
+    assert inventory_system.unequip_weapon(loaded) == "iron_sword"
+    assert loaded['strength'] == base_strength
+
+# ============================================================================
+# STAT ENGINE TESTS
+# ============================================================================
+
+def test_stat_engine_separates_base_and_gear():
+    """Test modifier stacks from several sources"""
+    char = character_manager.create_character("Stacked", "Warrior")
+    engine = inventory_system.StatEngine.for_character(char)
+
+    engine.set_modifiers("weapon", [("strength", 5)])
+    engine.set_modifiers("buff:rage", [("strength", 3), ("max_health", -10)])
+
+    assert char['strength'] == 23 and engine.base_stat("strength") == 15
+    assert char['max_health'] == 110
+    assert engine.remove_modifiers("buff:rage") == (("strength", 3), ("max_health", -10))
+    assert (char['strength'], char['max_health']) == (20, 120)
+    assert inventory_system.StatEngine.for_character(char) is engine
+
+@pytest.mark.parametrize("save_format", ["text", "binary"])
+def test_buff_sources_survive_save_and_load(tmp_path, save_format):
+    """Test that modifier sources containing colons round-trip"""
+    char = character_manager.create_character("Blessed", "Cleric")
+    engine = inventory_system.StatEngine.for_character(char)
+    engine.set_modifiers("buff:bless", [("strength", 3)])
+    engine.set_modifiers("weapon", [("magic", 4)])
+
+    character_manager.save_character(char, str(tmp_path), save_format=save_format)
+    loaded = character_manager.load_character("Blessed", str(tmp_path))
+
+    assert loaded['stat_modifiers'] == {"buff:bless": (("strength", 3),), "weapon": (("magic", 4),)}
+    assert inventory_system.StatEngine.for_character(loaded).base_stat("strength") == 10
+
+def test_stat_engine_rejects_commas_in_sources():
+    """Test that sources that could not be saved are refused"""
+    char = character_manager.create_character("Comma", "Rogue")
+
+    with pytest.raises(ValueError):
+        inventory_system.StatEngine.for_character(char).set_modifiers("buff,rage", [("strength", 3)])
+    assert char['stat_modifiers'] == {}
+
+def test_stat_engine_keeps_level_ups_when_unequipping():
+    """Test that direct stat changes while equipped go to the base stat"""
+    char = character_manager.create_character("Grower", "Rogue")
+    inventory_system.add_item_to_inventory(char, "iron_sword")
+    inventory_system.equip_weapon(char, "iron_sword", {"type": "weapon", "effect": "strength:5"})
+
+    character_manager.gain_experience(char, 100)
+    assert char['strength'] == 12 + 5 + 2
+
+    inventory_system.unequip_weapon(char)
+    assert char['strength'] == 14
+
+def test_stat_engine_only_recomputes_on_modifier_change(monkeypatch):
+    """Test that reading effective stats does not re-total the modifiers"""
+    char = character_manager.create_character("Cached", "Mage")
+    engine = inventory_system.StatEngine.for_character(char)
+    engine.set_modifiers("armor", [("max_health", 15)])
+    calls = []
+    original = inventory_system.StatEngine._totals
+
+    def counting(self):
+        calls.append(1)
+        return original(self)
+
+    monkeypatch.setattr(inventory_system.StatEngine, "_totals", counting)
+    for _ in range(100):
+        assert engine.effective_stat("max_health") == 95
+    assert calls == []
+
+    engine.remove_modifiers("armor")
+    assert len(calls) == 1
+
+def test_stat_engine_rebuilt_after_load(tmp_path):
+    """Test that base stats are recovered from a saved character"""
+    char = character_manager.create_character("Reloaded", "Cleric")
+    inventory_system.StatEngine.for_character(char).set_modifiers("weapon", [("magic", 4)])
+    character_manager.save_character(char, str(tmp_path))
+
+    loaded = character_manager.load_character("Reloaded", str(tmp_path))
+    engine = inventory_system.StatEngine.for_character(loaded)
+
+    assert loaded['magic'] == 19 and engine.base_stat("magic") == 15
+    engine.remove_modifiers("weapon")
+    assert loaded['magic'] == 15
+    assert "_stat_engine" not in character_manager._serialize_character(loaded).lower()
+
+# ============================================================================
+# SHOP TRANSACTION TESTS
+# ============================================================================
+
+CATALOG = {
+    "health_potion": {"cost": 25, "type": "consumable"},
+    "iron_sword": {"cost": 100, "type": "weapon"}
+}
+
+def test_purchase_items_bulk_order():
+    """Test that a bulk order is charged and stocked in one step"""
+    char = character_manager.create_character("Buyer", "Rogue")
+    character_manager.add_gold(char, 400)
+
+    receipt = inventory_system.purchase_items(char, [("health_potion", 15), ("iron_sword", 1)], CATALOG)
+
+    assert receipt["total"] == 475 and receipt["gold"] == 25
+    assert receipt["lines"][0] == ("health_potion", 15, 25, 375)
+    assert char['inventory'].count("health_potion") == 15
+    assert len(char['inventory']) == 16
+
+@pytest.mark.parametrize("order, error", [
+    ([("health_potion", 4), ("iron_sword", 1)], InsufficientResourcesError),
+    ([("health_potion", 2), ("iron_sword", 0)], ValueError),
+    ([("health_potion", 2), ("dragon_egg", 1)], ItemNotFoundError),
+    ([("health_potion", 3)] * 7, InventoryFullError)
+])
+def test_purchase_items_is_all_or_nothing(order, error):
+    """Test that a failing order leaves gold and inventory untouched"""
+    char = character_manager.create_character("Careful", "Mage")
+    character_manager.add_gold(char, 500 if error is InventoryFullError else 0)
+    gold = char['gold']
+
+    with pytest.raises(error):
+        inventory_system.purchase_items(char, order, CATALOG)
+
+    assert char['gold'] == gold
+    assert len(char['inventory']) == 0
+
+def test_sell_items_checks_quantities_first():
+    """Test selling a batch, and that a short batch sells nothing"""
+    char = {'gold': 0, 'inventory': ["health_potion"] * 3 + ["iron_sword"]}
+
+    with pytest.raises(ItemNotFoundError):
+        inventory_system.sell_items(char, [("health_potion", 2), ("health_potion", 2)], CATALOG)
+    assert len(char['inventory']) == 4
+
+    receipt = inventory_system.sell_items(char, [("health_potion", 3), ("iron_sword", 1)], CATALOG)
+    assert receipt["total"] == 3 * 12 + 50 == char['gold']
+    assert char['inventory'] == []
+
+# ============================================================================
+# SHOP CATALOG TESTS
+# ============================================================================
+
+def make_catalog_items(count):
+    types = ["weapon", "armor", "consumable"]
+    return {
+        f"item_{i}": {"name": f"Item {i}", "type": types[i % 3], "cost": (i * 37) % 250}
+        for i in range(count)
+    }
+
+def test_catalog_queries_match_full_scan():
+    """Test type and price band queries against filtering every item"""
+    items = make_catalog_items(300)
+    catalog = inventory_system.ShopCatalog(items)
+
+    for item_type in [None, "weapon", "consumable"]:
+        for low, high in [(None, None), (None, 100), (50, 60), (200, None), (300, 400)]:
+            expected = sorted(
+                (item["cost"], item_id) for item_id, item in items.items()
+                if (item_type is None or item["type"] == item_type)
+                and (low is None or item["cost"] >= low)
+                and (high is None or item["cost"] <= high)
+            )
+            assert catalog.count(item_type, low, high) == len(expected)
+            page_two = catalog.query(item_type, low, high, page=2, page_size=7)
+            assert [item_id for item_id, item in page_two] == [item_id for cost, item_id in expected[7:14]]
+
+@pytest.mark.parametrize("page", [0, -1])
+def test_catalog_rejects_pages_below_one(page):
+    """Test that a bad page never returns items outside the price band"""
+    catalog = inventory_system.ShopCatalog(make_catalog_items(30))
+
+    with pytest.raises(ValueError):
+        catalog.query(min_cost=50, page=page)
+    with pytest.raises(ValueError):
+        catalog.render(min_cost=50, page=page)
+    with pytest.raises(ValueError):
+        catalog.query(page=1, page_size=0)
+
+def test_catalog_affordable_weapons():
+    """Test the "weapons I can afford" query on the shipped items"""
+    catalog = inventory_system.ShopCatalog(game_data.load_items("data/items.txt"))
+
+    weapons = catalog.affordable(100, "weapon")
+
+    assert weapons
+    assert all(item["type"] == "weapon" and item["cost"] <= 100 for item_id, item in weapons)
+
+def test_catalog_rendering_is_cached_until_changed():
+    """Test that listings are rebuilt only after add_item or remove_item"""
+    catalog = inventory_system.ShopCatalog(make_catalog_items(30))
+
+    listing = catalog.render(page=1)
+    assert catalog.render(page=1) == listing
+    assert listing.splitlines()[-1] == "Page 1 of 3"
+
+    catalog.add_item("bargain", {"name": "Bargain", "type": "consumable", "cost": -1})
+    assert catalog.render(page=1).splitlines()[0] == "bargain: consumable - Cost: -1"
+
+    catalog.remove_item("bargain")
+    assert catalog.render(page=1) == listing
+    with pytest.raises(ItemNotFoundError):
+        catalog.remove_item("bargain")
+
+def test_catalog_render_cache_does_not_grow_with_gold():
+    """Test that affordable listings for every gold amount share one cache entry"""
+    catalog = inventory_system.ShopCatalog(make_catalog_items(60))
+
+    for gold in range(300):
+        for page in [1, 2]:
+            expected = [
+                f"{item_id}: {item['type']} - Cost: {item['cost']}"
+                for item_id, item in catalog.affordable(gold, page=page)
+            ]
+            assert catalog.render(max_cost=gold, page=page).splitlines()[:-1] == expected
+
+    assert len(catalog._lines) == 1
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,181 @@
+"""
+Test Combat Engine
+Tests headless battles and the combat rules they share with SimpleBattle
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import combat_system
+
+# ============================================================================
+# HEADLESS BATTLE TESTS
+# ============================================================================
+
+def test_headless_battle_does_not_read_or_print(monkeypatch, capsys):
+    """Test that a policy replaces stdin and nothing is printed"""
+    def no_input(prompt=""):
+        raise AssertionError("headless battles must not call input()")
+
+    monkeypatch.setattr("builtins.input", no_input)
+    char = character_manager.create_character("Headless", "Warrior")
+    enemy = combat_system.create_enemy("goblin")
+
+    result = combat_system.run_headless_battle(char, enemy, lambda battle: "attack")
+
+    assert result["winner"] == "player"
+    assert char["experience"] == enemy["xp_reward"]
+    assert capsys.readouterr().out == ""
+
+def test_headless_battle_sends_log_to_sink():
+    """Test that log lines go to the supplied sink"""
+    lines = []
+    char = character_manager.create_character("Logger", "Mage")
+    enemy = combat_system.create_enemy("goblin")
+
+    combat_system.run_headless_battle(char, enemy, ["special", "2", "1"], log=lines.append)
+
+    assert lines[0].startswith("Fireball!")
+    assert lines[-1] == "You defeated the enemy!"
+
+def test_headless_battle_result_matches_start_battle(monkeypatch):
+    """Test that scripted and interactive battles give the same result"""
+    choices = iter(["1"] * 50)
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(choices))
+
+    interactive = combat_system.SimpleBattle(
+        character_manager.create_character("A", "Rogue"),
+        combat_system.create_enemy("orc")
+    ).start_battle()
+    headless = combat_system.SimpleBattle(
+        character_manager.create_character("B", "Rogue"),
+        combat_system.create_enemy("orc"),
+        policy=["1"] * 50
+    ).start_battle()
+
+    assert headless == interactive
+
+def test_headless_battle_max_turns_draw():
+    """Test that a stalemate ends as a draw when max_turns is set"""
+    char = character_manager.create_character("Healer", "Cleric")
+    enemy = combat_system.create_enemy("goblin")
+
+    result = combat_system.run_headless_battle(char, enemy, lambda battle: "special", max_turns=25)
+
+    assert result["winner"] == "draw"
+    assert enemy["health"] == enemy["max_health"]
+
+# ============================================================================
+# SEEDED RANDOMNESS TESTS
+# ============================================================================
+
+def replay(seed, actions):
+    lines = []
+    char = character_manager.create_character("Replay", "Rogue")
+    enemy = combat_system.create_enemy("dragon")
+    battle = combat_system.SimpleBattle(char, enemy, policy=actions, log=lines.append, seed=seed)
+    result = battle.start_battle()
+    return battle.seed, result, lines, char["health"]
+
+def test_battle_only_marks_the_player_dirty():
+    """Test that damaging the enemy leaves no save-tracking state on it"""
+    char = character_manager.create_character("Dirty", "Warrior")
+    enemy = combat_system.create_enemy("goblin")
+    battle = combat_system.SimpleBattle(char, enemy)
+
+    battle.apply_damage(enemy, 5)
+    battle.apply_damage(char, 5)
+
+    assert "_version" not in enemy
+    assert char.get("_version", 0) > 0
+
+def test_battles_replay_from_seed():
+    """Test that the same seed and actions reproduce a battle exactly"""
+    actions = ["special", "run", "special", "special", "run", "special"] * 5
+
+    assert replay(1234, actions) == replay(1234, actions)
+
+def test_battle_seed_is_recorded():
+    """Test that an unseeded battle keeps the seed it picked"""
+    actions = ["special", "run"] * 10
+    seed, result, lines, health = replay(None, actions)
+
+    assert seed is not None
+    assert replay(seed, actions) == (seed, result, lines, health)
+
+def test_battle_ignores_global_random_state():
+    """Test that reseeding the random module does not change a seeded battle"""
+    import random
+    actions = ["special"] * 10
+
+    random.seed(1)
+    first = replay(99, actions)
+    random.seed(2)
+    second = replay(99, actions)
+
+    assert first == second
+
+# ============================================================================
+# BALANCE SIMULATION TESTS
+# ============================================================================
+
+def headless_result(character_class, enemy_type, level, action):
+    char = character_manager.create_character("Check", character_class)
+    if level > 1:
+        character_manager.gain_experience(char, 50 * level * (level - 1))
+    battle = combat_system.SimpleBattle(char, combat_system.create_enemy(enemy_type),
+                                        policy=lambda b: action, max_turns=1000)
+    return battle.start_battle()["winner"], battle.turn
+
+@pytest.mark.parametrize("character_class", ["Warrior", "Mage", "Rogue", "Cleric"])
+@pytest.mark.parametrize("enemy_type", ["goblin", "orc", "dragon"])
+def test_simulation_matches_headless_battles(character_class, enemy_type):
+    """Test that deterministic matchups agree with SimpleBattle turn for turn"""
+    level = 3
+    winner, turns = headless_result(character_class, enemy_type, level, "attack")
+
+    stats = combat_system.simulate_battles(character_class, enemy_type, level, battles=10)
+
+    expected = {"player": "wins", "enemy": "losses", "draw": "draws"}[winner]
+    assert stats[expected] == 10
+    assert stats["turn_counts"] == {turns: 10}
+
+@pytest.mark.parametrize("character_class", ["Warrior", "Mage", "Cleric"])
+def test_simulation_matches_headless_specials(character_class):
+    """Test that special abilities deal the same damage in both engines"""
+    winner, turns = headless_result(character_class, "orc", 2, "special")
+
+    stats = combat_system.simulate_battles(character_class, "orc", 2, battles=5, action="special")
+
+    expected = {"player": "wins", "enemy": "losses", "draw": "draws"}[winner]
+    assert stats[expected] == 5
+    assert stats["turn_counts"] == {turns: 5}
+
+def test_simulation_uses_crit_rule(monkeypatch):
+    """Test the rogue special against SimpleBattle with a guaranteed crit"""
+    monkeypatch.setattr(combat_system, "ROGUE_CRIT_CHANCE", 1.0)
+    winner, turns = headless_result("Rogue", "orc", 1, "special")
+
+    stats = combat_system.simulate_battles("Rogue", "orc", 1, battles=50, action="special")
+
+    assert winner == "player"
+    assert stats["wins"] == 50 and stats["mean_turns"] == turns
+
+def test_simulate_matchups_is_seeded_and_complete():
+    """Test that every pairing is reported and seeds reproduce results"""
+    first = combat_system.simulate_matchups(levels=(1, 5), battles=200, action="run", seed=7)
+    second = combat_system.simulate_matchups(levels=(1, 5), battles=200, action="run", seed=7)
+
+    assert len(first) == 4 * 3 * 2
+    assert first == second
+    for stats in first.values():
+        total = stats["wins"] + stats["losses"] + stats["escapes"] + stats["draws"]
+        assert total == 200
+        assert sum(stats["turn_counts"].values()) == 200
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,234 @@
+"""
+Test Game Data Loading
+Tests the compiled data cache and the data file loaders
+"""
+
+import pytest
+import sys
+import os
+import pickle
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+import character_manager
+import combat_system
+from custom_exceptions import InvalidDataFormatError, InvalidTargetError, MissingDataFileError
+
+QUEST_BLOCK = """QUEST_ID: {quest_id}
+TITLE: Quest {quest_id}
+DESCRIPTION: A test quest
+REWARD_XP: 50
+REWARD_GOLD: 25
+REQUIRED_LEVEL: 1
+PREREQUISITE: NONE
+"""
+
+def write_quests(path, quest_ids):
+    path.write_text("\n".join(QUEST_BLOCK.format(quest_id=q) for q in quest_ids))
+    return str(path)
+
+# ============================================================================
+# COMPILED CACHE TESTS
+# ============================================================================
+
+def test_cache_written_after_first_load(tmp_path):
+    """Test that loading a data file writes a compiled cache next to it"""
+    filename = write_quests(tmp_path / "quests.txt", ["a", "b"])
+
+    quests = game_data.load_quests(filename)
+
+    assert list(quests) == ["a", "b"]
+    assert os.path.exists(game_data.get_cache_path(filename))
+
+def test_warm_load_skips_parsing(tmp_path, monkeypatch):
+    """Test that a valid cache is used without parsing the text again"""
+    filename = write_quests(tmp_path / "quests.txt", ["a", "b"])
+    expected = game_data.load_quests(filename)
+
+    def fail(lines):
+        raise AssertionError("text parser should not run on a warm load")
+
+    monkeypatch.setattr(game_data, "parse_quest_block", fail)
+    assert game_data.load_quests(filename) == expected
+
+def test_cache_invalidated_when_source_changes(tmp_path):
+    """Test that editing the source file falls back to the text parser"""
+    filename = write_quests(tmp_path / "quests.txt", ["a"])
+    game_data.load_quests(filename)
+
+    write_quests(tmp_path / "quests.txt", ["a", "b"])
+
+    assert list(game_data.load_quests(filename)) == ["a", "b"]
+
+def test_corrupted_cache_is_ignored(tmp_path):
+    """Test that an unreadable cache file does not break loading"""
+    filename = write_quests(tmp_path / "quests.txt", ["a"])
+    game_data.load_quests(filename)
+
+    with open(game_data.get_cache_path(filename), "wb") as f:
+        f.write(b"not a cache")
+
+    assert list(game_data.load_quests(filename)) == ["a"]
+
+def test_warm_item_load_matches_cold_load(tmp_path):
+    """Test that cached items come back with the same types, modifiers included"""
+    path = tmp_path / "items.txt"
+    with open("data/items.txt") as f:
+        path.write_text(f.read())
+    cold = game_data.load_items(str(path))
+
+    warm = game_data.load_items(str(path))
+
+    assert warm == cold
+    assert all(isinstance(item["modifiers"], tuple) for item in warm.values())
+
+def test_cache_is_not_executable(tmp_path):
+    """Test that a pickle dropped in place of the cache is never unpickled"""
+    filename = write_quests(tmp_path / "quests.txt", ["a"])
+
+    class Payload:
+        def __reduce__(self):
+            return (os.mkdir, (str(tmp_path / "pwned"),))
+
+    with open(game_data.get_cache_path(filename), "wb") as f:
+        pickle.dump(Payload(), f)
+
+    assert list(game_data.load_quests(filename)) == ["a"]
+    assert not (tmp_path / "pwned").exists()
+
+def test_invalid_data_is_never_cached(tmp_path):
+    """Test that a file that fails validation keeps failing"""
+    path = tmp_path / "quests.txt"
+    path.write_text(QUEST_BLOCK.format(quest_id="a").replace("REWARD_XP: 50", "REWARD_XP: lots"))
+
+    for _ in range(2):
+        with pytest.raises(InvalidDataFormatError):
+            game_data.load_quests(str(path))
+    assert not os.path.exists(game_data.get_cache_path(str(path)))
+
+# ============================================================================
+# STREAMING PARSER TESTS
+# ============================================================================
+
+def test_iter_quests_yields_records_lazily(tmp_path):
+    """Test that quests are yielded before later blocks are parsed"""
+    path = tmp_path / "quests.txt"
+    path.write_text(QUEST_BLOCK.format(quest_id="a") + "\nTHIS IS NOT VALID\n")
+
+    quests = game_data.iter_quests(str(path))
+    first = next(quests)
+
+    assert first["quest_id"] == "a"
+    assert first["reward_xp"] == 50
+    with pytest.raises(InvalidDataFormatError, match="line 9"):
+        next(quests)
+
+def test_iter_items_matches_load_items():
+    """Test that the streaming parser agrees with load_items"""
+    items = list(game_data.iter_items("data/items.txt"))
+
+    assert {item["item_id"]: item for item in items} == game_data.load_items("data/items.txt", use_cache=False)
+
+def test_extra_blank_lines_between_blocks(tmp_path):
+    """Test that runs of blank lines separate blocks like a single one"""
+    path = tmp_path / "quests.txt"
+    path.write_text(QUEST_BLOCK.format(quest_id="a") + "\n\n  \n" + QUEST_BLOCK.format(quest_id="b"))
+
+    assert [q["quest_id"] for q in game_data.iter_quests(str(path))] == ["a", "b"]
+
+# ============================================================================
+# CONTENT DIRECTORY TESTS
+# ============================================================================
+
+def test_load_content_dir_merges_shards(tmp_path):
+    """Test that quest and item shards are merged across worker processes"""
+    write_quests(tmp_path / "quests_north.txt", ["a", "b"])
+    write_quests(tmp_path / "quests_south.txt", ["c"])
+    with open("data/items.txt") as f:
+        (tmp_path / "items.txt").write_text(f.read())
+
+    quests, items = game_data.load_content_dir(str(tmp_path), workers=2)
+
+    assert sorted(quests) == ["a", "b", "c"]
+    assert items == game_data.load_items("data/items.txt")
+
+def test_load_content_dir_reports_duplicates(tmp_path):
+    """Test that IDs defined by two shards name both locations"""
+    write_quests(tmp_path / "quests_a.txt", ["shared"])
+    write_quests(tmp_path / "quests_b.txt", ["other", "shared"])
+
+    with pytest.raises(InvalidDataFormatError) as error:
+        game_data.load_content_dir(str(tmp_path), workers=1)
+
+    message = str(error.value)
+    assert "quests_a.txt line 1" in message
+    assert "quests_b.txt line 9" in message
+
+# ============================================================================
+# DEFINITION TABLE TESTS
+# ============================================================================
+
+@pytest.fixture
+def definition_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(game_data, "CLASSES_FILE", str(tmp_path / "classes.txt"))
+    monkeypatch.setattr(game_data, "ENEMIES_FILE", str(tmp_path / "enemies.txt"))
+    game_data.reload_definition_tables()
+    yield tmp_path
+    monkeypatch.undo()
+    game_data.reload_definition_tables()
+
+def test_shipped_definitions_match_defaults(tmp_path, monkeypatch):
+    """Test that create_default_data_files writes the shipped classes and enemies"""
+    shipped_classes = game_data.load_classes("data/classes.txt", use_cache=False)
+    shipped_enemies = game_data.load_enemies("data/enemies.txt", use_cache=False)
+    monkeypatch.chdir(tmp_path)
+
+    game_data.create_default_data_files()
+
+    assert game_data.load_classes("data/classes.txt", use_cache=False) == shipped_classes
+    assert game_data.load_enemies("data/enemies.txt", use_cache=False) == shipped_enemies
+
+def test_missing_definition_files_raise(definition_files):
+    """Test that a missing classes.txt is an error, not a silent fallback"""
+    with pytest.raises(MissingDataFileError):
+        game_data.get_class_table()
+    with pytest.raises(MissingDataFileError):
+        character_manager.create_character("Nobody", "Warrior")
+    with pytest.raises(MissingDataFileError):
+        combat_system.create_enemy("goblin")
+
+def test_definition_tables_are_read_only():
+    """Test that the cached tables cannot be changed by callers"""
+    classes = game_data.get_class_table()
+
+    assert game_data.get_class_table() is classes
+    with pytest.raises(TypeError):
+        classes["Bard"] = {}
+    with pytest.raises(TypeError):
+        classes["Mage"]["magic"] = 99
+
+def test_new_class_and_enemy_from_data_files(definition_files):
+    """Test that designers can add a class and an enemy without code changes"""
+    (definition_files / "classes.txt").write_text("CLASS_ID: Bard\nHEALTH: 95\nSTRENGTH: 9\nMAGIC: 14\n")
+    (definition_files / "enemies.txt").write_text(
+        "ENEMY_ID: Slime\nHEALTH: 20\nSTRENGTH: 3\nMAGIC: 0\nXP_REWARD: 5\nGOLD_REWARD: 1\n"
+    )
+
+    bard = character_manager.create_character("Lute", "Bard")
+    slime = combat_system.create_enemy("SLIME")
+
+    assert (bard["max_health"], bard["strength"], bard["magic"]) == (95, 9, 14)
+    assert slime["name"] == "Slime" and slime["max_health"] == 20
+    with pytest.raises(InvalidTargetError):
+        combat_system.create_enemy("goblin")
+
+def test_invalid_definition_file(definition_files):
+    """Test that a malformed class file is reported"""
+    (definition_files / "classes.txt").write_text("CLASS_ID: Bard\nHEALTH: lots\nSTRENGTH: 9\nMAGIC: 1\n")
+
+    with pytest.raises(InvalidDataFormatError):
+        game_data.get_class_table()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
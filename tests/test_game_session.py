@@ -0,0 +1,106 @@
+"""
+Test Game Session
+Tests driving the game through GameSession commands instead of menus
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+from custom_exceptions import CharacterNotFoundError, InsufficientResourcesError
+
+SCRIPT = [
+    "new Ayla Warrior",
+    "buy health_potion 2",
+    "accept first_steps",
+    "explore attack",
+    "explore special run",
+    "complete first_steps",
+    "use health_potion",
+    "sell health_potion",
+    "quests completed"
+]
+
+def snapshot(results):
+    return [r if isinstance(r, (list, dict, bool, str, type(None))) else repr(r) for r in results]
+
+# ============================================================================
+# GAME SESSION TESTS
+# ============================================================================
+
+def test_session_runs_without_terminal_io(monkeypatch, capsys):
+    """Test that a whole script runs with no input() and no printing"""
+    def no_input(prompt=""):
+        raise AssertionError("sessions must not call input()")
+
+    monkeypatch.setattr("builtins.input", no_input)
+    session = main.GameSession.from_data_files(seed=5)
+
+    results = session.run_script(SCRIPT)
+
+    assert results[-1] == ["first_steps"]
+    assert session.character['inventory'].count("health_potion") == 0
+    assert capsys.readouterr().out == ""
+
+def test_session_replays_from_seed():
+    """Test that the same seed and script give the same game"""
+    first = main.GameSession.from_data_files(seed=42)
+    second = main.GameSession.from_data_files(seed=42)
+
+    assert snapshot(first.run_script(SCRIPT * 3)) == snapshot(second.run_script(SCRIPT * 3))
+    assert first.stats() == second.stats()
+
+def test_session_errors():
+    """Test that execute raises game errors and run_script records them"""
+    session = main.GameSession.from_data_files()
+
+    with pytest.raises(CharacterNotFoundError):
+        session.execute("stats")
+    with pytest.raises(ValueError):
+        session.execute("dance")
+
+    session.execute("new", "Poor", "Mage")
+    results = session.run_script([("buy", "iron_sword", 5), "buy health_potion"])
+
+    assert isinstance(results[0], InsufficientResourcesError)
+    assert results[1]["gold"] == 75
+
+def test_session_records_bad_arguments():
+    """Test that wrong argument counts are recorded without stopping the script"""
+    session = main.GameSession.from_data_files()
+
+    results = session.run_script(["new Ayla Warrior", "buy", "", "stats extra", "buy health_potion"])
+
+    assert all(isinstance(result, ValueError) for result in results[1:4])
+    assert session.execute("inventory") == [("health_potion", 1)]
+    with pytest.raises(ValueError):
+        session.execute("sell")
+
+def test_session_shop_parses_affordable_flag():
+    """Test that "false" from a script does not filter the shop"""
+    session = main.GameSession.from_data_files()
+    session.execute("new", "Shopper", "Rogue")
+    session.character['gold'] = 0
+
+    results = session.run_script(["shop weapon 1 false", "shop weapon 1 true", "shop weapon 1 maybe"])
+
+    assert results[0] == session.execute("shop", "weapon") != []
+    assert results[1] == session.execute("shop", "weapon", 1, True) == []
+    assert isinstance(results[2], ValueError)
+
+def test_session_save_and_load(tmp_path):
+    """Test that sessions share characters through the save directory"""
+    writer = main.GameSession.from_data_files(save_directory=str(tmp_path))
+    writer.run_script(["new Keeper Cleric", "buy health_potion 3", "save"])
+
+    reader = main.GameSession.from_data_files(save_directory=str(tmp_path))
+    reader.execute("load", "Keeper")
+
+    assert reader.execute("inventory") == [("health_potion", 3)]
+    assert reader.execute("quests", "available") == writer.execute("quests")
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,158 @@
+"""
+Test Quest Index
+Tests that indexed quest lookups agree with the plain quest functions
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import quest_handler
+import game_data
+from custom_exceptions import QuestNotFoundError
+
+def make_quest(quest_id, level=1, prerequisite="NONE"):
+    return {
+        'quest_id': quest_id,
+        'title': quest_id.title(),
+        'description': 'A test quest',
+        'reward_xp': 50,
+        'reward_gold': 25,
+        'required_level': level,
+        'prerequisite': prerequisite
+    }
+
+# ============================================================================
+# QUEST INDEX TESTS
+# ============================================================================
+
+def test_available_quests_match_full_scan():
+    """Test that the index finds the same quests as a full scan"""
+    quests = game_data.load_quests("data/quests.txt")
+    index = quest_handler.QuestIndex(quests)
+    char = character_manager.create_character("IndexTest", "Warrior")
+
+    for level in range(1, 12):
+        char['level'] = level
+        for qid in list(quests):
+            expected = quest_handler.get_available_quests(char, quests)
+            assert quest_handler.get_available_quests(char, quests, index) == expected
+            if quest_handler.can_accept_quest(char, qid, quests):
+                char['completed_quests'].append(qid)
+
+def test_available_quests_skip_active_and_completed():
+    """Test that active and completed quests are not offered"""
+    quests = {
+        'a': make_quest('a'),
+        'b': make_quest('b', prerequisite='a'),
+        'c': make_quest('c', prerequisite='a'),
+        'd': make_quest('d', level=5, prerequisite='a')
+    }
+    index = quest_handler.QuestIndex(quests)
+    char = {'level': 1, 'active_quests': ['c'], 'completed_quests': ['a']}
+
+    available = index.available_quests(char)
+
+    assert [q['quest_id'] for q in available] == ['b']
+
+def test_index_depth_and_children():
+    """Test the precomputed graph structure"""
+    quests = {
+        'a': make_quest('a'),
+        'b': make_quest('b', prerequisite='a'),
+        'c': make_quest('c', prerequisite='b'),
+        'orphan': make_quest('orphan', prerequisite='missing')
+    }
+    index = quest_handler.QuestIndex(quests)
+
+    assert index.children['a'] == ['b']
+    assert index.depth == {'a': 0, 'b': 1, 'c': 2, 'orphan': None}
+
+def test_prerequisite_chain_is_memoized_and_copied():
+    """Test chains from the index and that callers cannot corrupt them"""
+    quests = {
+        'a': make_quest('a'),
+        'b': make_quest('b', prerequisite='a'),
+        'c': make_quest('c', prerequisite='b')
+    }
+    index = quest_handler.QuestIndex(quests)
+
+    chain = quest_handler.get_quest_prerequisite_chain('c', quests, index)
+    chain.append('junk')
+
+    assert quest_handler.get_quest_prerequisite_chain('c', quests, index) == ['a', 'b', 'c']
+    assert index.prerequisite_chain('b') == ['a', 'b']
+
+def test_prerequisite_chain_errors_match_plain_function():
+    """Test that broken chains behave like the unindexed walk"""
+    quests = {
+        'orphan': make_quest('orphan', prerequisite='missing'),
+        'x': make_quest('x', prerequisite='y'),
+        'y': make_quest('y', prerequisite='x')
+    }
+    index = quest_handler.QuestIndex(quests)
+
+    with pytest.raises(QuestNotFoundError):
+        index.prerequisite_chain('orphan')
+    with pytest.raises(QuestNotFoundError):
+        index.prerequisite_chain('unknown')
+    assert index.prerequisite_chain('x') == quest_handler.get_quest_prerequisite_chain('x', quests)
+
+def test_quests_by_level_uses_buckets():
+    """Test level range queries against the plain function"""
+    quests = game_data.load_quests("data/quests.txt")
+    index = quest_handler.QuestIndex(quests)
+
+    for low, high in [(1, 1), (2, 5), (0, 100), (7, 3)]:
+        expected = quest_handler.get_quests_by_level(quests, low, high)
+        assert quest_handler.get_quests_by_level(quests, low, high, index) == expected
+
+# ============================================================================
+# AVAILABILITY TRACKER TESTS
+# ============================================================================
+
+def test_tracker_follows_quest_actions_and_level_ups():
+    """Test that the tracked set matches a full scan after every action"""
+    quests = game_data.load_quests("data/quests.txt")
+    index = quest_handler.QuestIndex(quests)
+    char = character_manager.create_character("TrackerTest", "Mage")
+    quest_handler.track_available_quests(char, index)
+
+    def check():
+        tracked = quest_handler.get_available_quests(char, quests)
+        assert tracked == quest_handler.QuestIndex(quests).available_quests(char)
+
+    check()
+    for _ in range(len(quests)):
+        available = quest_handler.get_available_quests(char, quests)
+        if not available:
+            character_manager.gain_experience(char, char['level'] * 100)
+            check()
+            continue
+        qid = available[0]['quest_id']
+        quest_handler.accept_quest(char, qid, quests)
+        check()
+        quest_handler.abandon_quest(char, qid)
+        check()
+        quest_handler.accept_quest(char, qid, quests)
+        quest_handler.complete_quest(char, qid, quests)
+        check()
+
+    assert len(char['completed_quests']) > 1
+
+def test_tracker_is_not_saved(tmp_path):
+    """Test that runtime state on the character stays out of save files"""
+    quests = game_data.load_quests("data/quests.txt")
+    char = character_manager.create_character("TrackerSave", "Rogue")
+    quest_handler.track_available_quests(char, quest_handler.QuestIndex(quests))
+
+    character_manager.save_character(char, str(tmp_path))
+    loaded = character_manager.load_character("TrackerSave", str(tmp_path))
+
+    assert "_available_quests" not in loaded
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
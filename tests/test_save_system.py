@@ -0,0 +1,518 @@
+"""
+Test Save System
+Tests how characters are written to and read back from storage
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+from custom_exceptions import CharacterNotFoundError, InvalidSaveDataError
+
+# ============================================================================
+# ATOMIC SAVE TESTS
+# ============================================================================
+
+def test_failed_save_keeps_previous_file(tmp_path, monkeypatch):
+    """Test that a save interrupted before the rename leaves the old save"""
+    char = character_manager.create_character("CrashTest", "Warrior")
+    character_manager.save_character(char, str(tmp_path))
+
+    def crash(src, dst):
+        raise OSError("killed mid-save")
+
+    char['gold'] = 999
+    character_manager.mark_dirty(char)
+    monkeypatch.setattr(character_manager.os, "replace", crash)
+    with pytest.raises(OSError):
+        character_manager.save_character(char, str(tmp_path))
+    monkeypatch.undo()
+
+    assert character_manager.load_character("CrashTest", str(tmp_path))['gold'] == 100
+    assert sorted(os.listdir(tmp_path)) == [character_manager.SAVE_INDEX_FILENAME, "CrashTest_save.txt"]
+
+def test_rolling_backups(tmp_path):
+    """Test that backups keep the previous saves newest first"""
+    char = character_manager.create_character("BackupTest", "Mage")
+    for gold in [1, 2, 3, 4]:
+        char['gold'] = gold
+        character_manager.mark_dirty(char)
+        character_manager.save_character(char, str(tmp_path), backups=2)
+
+    save = tmp_path / "BackupTest_save.txt"
+    assert "GOLD: 4\n" in save.read_text()
+    assert "GOLD: 3\n" in (tmp_path / "BackupTest_save.txt.bak1").read_text()
+    assert "GOLD: 2\n" in (tmp_path / "BackupTest_save.txt.bak2").read_text()
+    assert not (tmp_path / "BackupTest_save.txt.bak3").exists()
+    assert character_manager.list_saved_characters(str(tmp_path)) == ["BackupTest"]
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_save_file_permissions(tmp_path):
+    """Test that saves get umask permissions and keep an existing file's mode"""
+    char = character_manager.create_character("ModeTest", "Rogue")
+    save = tmp_path / "ModeTest_save.txt"
+    umask = os.umask(0o022)
+    os.umask(umask)
+
+    character_manager.save_character(char, str(tmp_path))
+    assert save.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    save.chmod(0o640)
+    character_manager.mark_dirty(char)
+    character_manager.save_character(char, str(tmp_path))
+    assert save.stat().st_mode & 0o777 == 0o640
+
+def test_threaded_saves_never_touch_the_umask(tmp_path, monkeypatch):
+    """Test that new-file saves from pool threads do not change the process umask"""
+    def no_umask(mask):
+        raise AssertionError("the umask is process-wide; saves must not set it")
+
+    monkeypatch.setattr(character_manager.os, "umask", no_umask)
+    chars = [character_manager.create_character(f"Pool{i}", "Mage") for i in range(8)]
+
+    results = character_manager.save_characters(chars, str(tmp_path), workers=4, fsync=False)
+
+    assert all(result is True for result in results.values())
+
+# ============================================================================
+# SAVE DATABASE TESTS
+# ============================================================================
+
+@pytest.fixture
+def save_db(tmp_path):
+    path = str(tmp_path / "saves.db")
+    yield path
+    character_manager.close_save_databases()
+
+def test_database_backend_round_trip(save_db):
+    """Test the four save functions against a SQLite save database"""
+    char = character_manager.create_character("DbHero", "Cleric")
+    char['inventory'].append("health_potion")
+    char['completed_quests'].append("first_steps")
+
+    assert character_manager.save_character(char, save_db)
+    loaded = character_manager.load_character("DbHero", save_db)
+
+    assert loaded['class'] == "Cleric"
+    assert list(loaded['inventory']) == ["health_potion"]
+    assert list(loaded['completed_quests']) == ["first_steps"]
+    assert character_manager.list_saved_characters(save_db) == ["DbHero"]
+
+    assert character_manager.delete_character("DbHero", save_db)
+    assert character_manager.list_saved_characters(save_db) == []
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.load_character("DbHero", save_db)
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.delete_character("DbHero", save_db)
+
+def test_database_uses_wal_and_replaces_rows(save_db):
+    """Test that saving twice updates the single row"""
+    char = character_manager.create_character("Twice", "Rogue")
+    character_manager.save_character(char, save_db)
+    character_manager.add_gold(char, -95)
+    character_manager.save_character(char, save_db)
+
+    connection, lock = character_manager._open_save_database(save_db)
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert connection.execute("SELECT COUNT(*), gold FROM characters").fetchone() == (1, 5)
+
+def test_missing_database_is_empty(tmp_path):
+    """Test that a database that was never written has no characters"""
+    path = str(tmp_path / "none.db")
+
+    assert character_manager.list_saved_characters(path) == []
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.load_character("Nobody", path)
+    assert not os.path.exists(path)
+
+# ============================================================================
+# BATCH SAVE AND LOAD TESTS
+# ============================================================================
+
+@pytest.mark.parametrize("workers", [None, 4])
+def test_batch_save_and_load_files(tmp_path, workers):
+    """Test saving and loading many characters with per-character results"""
+    chars = [character_manager.create_character(f"Batch{i}", "Warrior") for i in range(10)]
+    broken = {"class": "Warrior"}
+
+    results = character_manager.save_characters(chars + [broken], str(tmp_path), workers=workers)
+
+    assert all(results[f"Batch{i}"] is True for i in range(10))
+    assert isinstance(results[None], InvalidSaveDataError)
+
+    loaded = character_manager.load_characters(["Batch3", "Missing", "Batch7"], str(tmp_path), workers=workers)
+    assert list(loaded) == ["Batch3", "Missing", "Batch7"]
+    assert loaded["Batch3"]["name"] == "Batch3"
+    assert isinstance(loaded["Missing"], CharacterNotFoundError)
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        [f"Batch{i}_save.txt" for i in range(10)] + [character_manager.SAVE_INDEX_FILENAME]
+    )
+
+def test_batch_save_and_load_database(save_db):
+    """Test that the database backend saves a batch in one transaction"""
+    chars = [character_manager.create_character(f"Row{i}", "Mage") for i in range(1200)]
+
+    results = character_manager.save_characters(chars, save_db)
+    loaded = character_manager.load_characters([f"Row{i}" for i in range(1200)] + ["Nope"], save_db)
+
+    assert all(result is True for result in results.values())
+    assert loaded["Row1199"]["class"] == "Mage"
+    assert isinstance(loaded["Nope"], CharacterNotFoundError)
+
+# ============================================================================
+# DIRTY TRACKING TESTS
+# ============================================================================
+
+def count_writes(monkeypatch):
+    writes = []
+    original = character_manager._atomic_write
+
+    def counting(filename, *args, **kwargs):
+        if filename.endswith("_save.txt"):
+            writes.append(filename)
+        return original(filename, *args, **kwargs)
+
+    monkeypatch.setattr(character_manager, "_atomic_write", counting)
+    return writes
+
+def test_unchanged_character_is_not_rewritten(tmp_path, monkeypatch):
+    """Test that saving an unchanged character skips the write"""
+    writes = count_writes(monkeypatch)
+    char = character_manager.create_character("Idle", "Warrior")
+
+    character_manager.save_character(char, str(tmp_path))
+    character_manager.save_character(char, str(tmp_path))
+    assert len(writes) == 1
+
+    character_manager.add_gold(char, 10)
+    character_manager.save_character(char, str(tmp_path))
+    assert len(writes) == 2
+
+    character_manager.save_character(char, str(tmp_path), force=True)
+    assert len(writes) == 3
+
+def test_loaded_character_is_clean(tmp_path, monkeypatch):
+    """Test that a freshly loaded character needs no save"""
+    for name in ["Loaded", "Resting"]:
+        character_manager.save_character(character_manager.create_character(name, "Mage"), str(tmp_path))
+    writes = count_writes(monkeypatch)
+
+    loaded = character_manager.load_character("Loaded", str(tmp_path))
+    resting = character_manager.load_character("Resting", str(tmp_path))
+    assert not character_manager.is_dirty(loaded, str(tmp_path))
+    assert character_manager.is_dirty(loaded, str(tmp_path / "elsewhere"))
+
+    inventory_system.add_item_to_inventory(loaded, "health_potion")
+    results = character_manager.save_characters([loaded, resting], str(tmp_path))
+
+    assert results == {"Loaded": True, "Resting": True}
+    assert writes == [os.path.join(str(tmp_path), "Loaded_save.txt")]
+
+def test_deleted_save_is_written_again(tmp_path):
+    """Test that a clean character is rewritten if its file disappeared"""
+    char = character_manager.create_character("Gone", "Rogue")
+    character_manager.save_character(char, str(tmp_path))
+    character_manager.delete_character("Gone", str(tmp_path))
+
+    character_manager.save_character(char, str(tmp_path))
+
+    assert character_manager.list_saved_characters(str(tmp_path)) == ["Gone"]
+
+def test_deleted_database_save_is_written_again(save_db):
+    """Test that a clean character is rewritten if its database row disappeared"""
+    char = character_manager.create_character("Gone", "Rogue")
+    character_manager.save_character(char, save_db)
+    character_manager.delete_character("Gone", save_db)
+
+    assert character_manager.is_dirty(char, save_db)
+    character_manager.save_character(char, save_db)
+
+    assert character_manager.list_saved_characters(save_db) == ["Gone"]
+
+# ============================================================================
+# BINARY SAVE FORMAT TESTS
+# ============================================================================
+
+def test_binary_round_trip_keeps_awkward_ids(tmp_path):
+    """Test that IDs with commas and extra fields survive a binary save"""
+    char = character_manager.create_character("Binary", "Warrior")
+    char['inventory'].append("sword, +1")
+    char['completed_quests'].append("quest:with:colons")
+    char['equipped_weapon'] = None
+    char['title'] = "Slayer"
+
+    character_manager.save_character(char, str(tmp_path), save_format="binary")
+    loaded = character_manager.load_character("Binary", str(tmp_path))
+
+    assert (tmp_path / "Binary_save.txt").read_bytes().startswith(character_manager.BINARY_SAVE_MAGIC)
+    assert list(loaded['inventory']) == ["sword, +1"]
+    assert list(loaded['completed_quests']) == ["quest:with:colons"]
+    assert loaded['equipped_weapon'] is None
+    assert loaded['title'] == "Slayer"
+    assert loaded['gold'] == 100 and loaded['level'] == 1
+
+def test_binary_save_is_smaller():
+    """Test that the binary encoding is more compact than the text format"""
+    char = character_manager.create_character("Compact", "Rogue")
+    for i in range(20):
+        char['completed_quests'].append(f"quest_{i}")
+
+    binary = character_manager.encode_binary_character(char)
+    text = character_manager._serialize_character(char).encode("utf-8")
+
+    assert len(binary) < len(text)
+
+def test_truncated_binary_save_is_invalid(tmp_path):
+    """Test that a damaged binary save raises InvalidSaveDataError"""
+    char = character_manager.create_character("Damaged", "Mage")
+    data = character_manager.encode_binary_character(char)
+    (tmp_path / "Damaged_save.txt").write_bytes(data[:-3])
+
+    with pytest.raises(InvalidSaveDataError):
+        character_manager.load_character("Damaged", str(tmp_path))
+
+def test_migrate_saves_to_binary_and_back(tmp_path):
+    """Test converting a directory of text saves to binary"""
+    for i in range(3):
+        char = character_manager.create_character(f"Old{i}", "Cleric")
+        character_manager.add_gold(char, i)
+        character_manager.save_character(char, str(tmp_path))
+    (tmp_path / "Broken_save.txt").write_text("garbage")
+
+    results = character_manager.migrate_saves(str(tmp_path), "binary")
+
+    assert [results[f"Old{i}"] for i in range(3)] == [True, True, True]
+    assert isinstance(results["Broken"], InvalidSaveDataError)
+    assert (tmp_path / "Old2_save.txt").read_bytes().startswith(character_manager.BINARY_SAVE_MAGIC)
+    assert character_manager.load_character("Old2", str(tmp_path))['gold'] == 102
+
+    character_manager.migrate_saves(str(tmp_path), "text")
+    assert (tmp_path / "Old2_save.txt").read_text().startswith("NAME: Old2")
+
+# ============================================================================
+# LAZY CHARACTER VIEW TESTS
+# ============================================================================
+
+@pytest.mark.parametrize("save_format", ["text", "binary"])
+def test_view_reads_fields_without_parsing_lists(tmp_path, monkeypatch, save_format):
+    """Test that summary fields are read without touching the list fields"""
+    char = character_manager.create_character("Viewed", "Mage")
+    character_manager.add_gold(char, 23)
+    char['inventory'].append("staff")
+    character_manager.save_character(char, str(tmp_path), save_format=save_format)
+
+    def fail(*args):
+        raise AssertionError("list fields should not be built")
+
+    view = character_manager.load_character_view("Viewed", str(tmp_path))
+    monkeypatch.setattr(character_manager, "Inventory", fail)
+    monkeypatch.setattr(character_manager, "OrderedIdSet", fail)
+
+    assert (view['name'], view['class'], view['level'], view['gold']) == ("Viewed", "Mage", 1, 123)
+    monkeypatch.undo()
+    assert list(view['inventory']) == ["staff"]
+    assert dict(view) == view.to_character()
+    assert view.to_character()['gold'] == 123
+
+def test_view_errors_surface_on_access(tmp_path):
+    """Test that a malformed field raises only when it is read"""
+    (tmp_path / "Odd_save.txt").write_text("NAME: Odd\nCLASS: Rogue\nLEVEL: high\n")
+
+    view = character_manager.load_character_view("Odd", str(tmp_path))
+
+    assert view['name'] == "Odd"
+    with pytest.raises(InvalidSaveDataError):
+        view['level']
+    with pytest.raises(InvalidSaveDataError):
+        view['gold']
+    assert view.get('title') is None
+
+def test_iter_character_views_for_leaderboard(tmp_path, save_db):
+    """Test scanning every save in a directory and a database"""
+    for store in [str(tmp_path / "saves"), save_db]:
+        chars = [character_manager.create_character(f"Hero{i}", "Warrior") for i in range(5)]
+        for i, char in enumerate(chars):
+            character_manager.add_gold(char, i * 10)
+        character_manager.save_characters(chars, store)
+
+        views = character_manager.iter_character_views(store)
+        board = sorted(((v['gold'], v['name']) for v in views), reverse=True)
+
+        assert board[0] == (140, "Hero4")
+        assert len(board) == 5
+
+# ============================================================================
+# SAVE INDEX TESTS
+# ============================================================================
+
+def test_save_index_answers_without_opening_saves(tmp_path, monkeypatch):
+    """Test that summaries follow saves and deletes without reading saves"""
+    chars = [character_manager.create_character(name, "Rogue") for name in ["Bea", "Al", "Cy"]]
+    character_manager.save_characters(chars, str(tmp_path))
+    character_manager.add_gold(chars[0], 50)
+    character_manager.save_character(chars[0], str(tmp_path), save_format="binary")
+    character_manager.delete_character("Cy", str(tmp_path))
+
+    def fail(*args):
+        raise AssertionError("saves should not be opened")
+
+    monkeypatch.setattr(character_manager, "_read_save", fail)
+    summaries = character_manager.get_save_summaries(str(tmp_path))
+
+    assert list(summaries) == ["Al", "Bea"]
+    assert summaries["Bea"]["gold"] == 150
+    assert summaries["Bea"]["class"] == "Rogue" and summaries["Bea"]["level"] == 1
+    assert summaries["Bea"]["size"] == os.path.getsize(tmp_path / "Bea_save.txt")
+    assert character_manager.list_saved_characters(str(tmp_path)) == ["Al", "Bea"]
+
+def test_rebuild_save_index_after_manual_changes(tmp_path):
+    """Test that a missing or damaged index is rebuilt from the files"""
+    character_manager.save_character(character_manager.create_character("Kept", "Mage"), str(tmp_path))
+    (tmp_path / "Copied_save.txt").write_text("NAME: Copied\nbroken")
+
+    assert character_manager.list_saved_characters(str(tmp_path)) == ["Kept"]
+    summaries = character_manager.rebuild_save_index(str(tmp_path))
+    assert summaries["Copied"]["class"] is None
+    assert summaries["Kept"]["class"] == "Mage"
+
+    (tmp_path / character_manager.SAVE_INDEX_FILENAME).write_text("{not json")
+    assert character_manager.list_saved_characters(str(tmp_path)) == ["Copied", "Kept"]
+
+    os.remove(tmp_path / character_manager.SAVE_INDEX_FILENAME)
+    assert character_manager.list_saved_characters(str(tmp_path)) == ["Copied", "Kept"]
+
+def test_save_index_is_compacted(tmp_path):
+    """Test that superseded journal lines are dropped eventually"""
+    char = character_manager.create_character("Busy", "Cleric")
+    for _ in range(200):
+        character_manager.add_gold(char, 1)
+        character_manager.save_character(char, str(tmp_path), fsync=False)
+
+    assert character_manager.get_save_summaries(str(tmp_path))["Busy"]["gold"] == 300
+    with open(tmp_path / character_manager.SAVE_INDEX_FILENAME) as f:
+        assert len(f.readlines()) <= 66
+
+def test_large_save_index_is_not_replayed_on_every_save(tmp_path, monkeypatch):
+    """Test that a fresh process does not re-read a big journal per append"""
+    chars = [character_manager.create_character(f"Crowd{i:04d}", "Rogue") for i in range(800)]
+    character_manager.save_characters(chars, str(tmp_path), fsync=False)
+    assert os.path.getsize(tmp_path / character_manager.SAVE_INDEX_FILENAME) > 64 * 1024
+    monkeypatch.setattr(character_manager, "_save_index_sizes", {})
+    replays = []
+    original = character_manager._read_save_index
+
+    def counting(save_directory):
+        replays.append(save_directory)
+        return original(save_directory)
+
+    monkeypatch.setattr(character_manager, "_read_save_index", counting)
+    for char in chars[:20]:
+        character_manager.add_gold(char, 1)
+        character_manager.save_character(char, str(tmp_path), fsync=False)
+
+    assert len(replays) <= 1
+    assert character_manager.get_save_summaries(str(tmp_path))["Crowd0000"]["gold"] == 101
+
+def test_database_summaries(save_db):
+    """Test that a save database summarizes from its table"""
+    char = character_manager.create_character("Tabled", "Warrior")
+    character_manager.save_character(char, save_db)
+
+    summary = character_manager.get_save_summaries(save_db)["Tabled"]
+
+    assert (summary["class"], summary["level"], summary["gold"]) == ("Warrior", 1, 100)
+    assert summary["size"] > 0
+
+# ============================================================================
+# CHARACTER CACHE TESTS
+# ============================================================================
+
+def save_heroes(directory, count):
+    chars = [character_manager.create_character(f"Cached{i}", "Warrior") for i in range(count)]
+    character_manager.save_characters(chars, directory)
+
+def test_cache_hits_misses_and_lru_order(tmp_path):
+    """Test that repeat lookups are served from memory in LRU order"""
+    save_heroes(str(tmp_path), 3)
+    cache = character_manager.CharacterCache(str(tmp_path), max_characters=2)
+
+    first = cache.get("Cached0")
+    assert cache.get("Cached0") is first
+    cache.get("Cached1")
+    cache.get("Cached0")
+    cache.get("Cached2")
+
+    assert "Cached0" in cache and "Cached1" not in cache
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 3, 1)
+    with pytest.raises(CharacterNotFoundError):
+        cache.get("Nobody")
+
+def test_cache_writes_back_dirty_characters(tmp_path, monkeypatch):
+    """Test that only changed characters are saved on eviction and flush"""
+    save_heroes(str(tmp_path), 3)
+    writes = count_writes(monkeypatch)
+    cache = character_manager.CharacterCache(str(tmp_path), max_characters=2)
+
+    character_manager.add_gold(cache.get("Cached0"), 5)
+    cache.get("Cached1")
+    cache.get("Cached2")
+    assert writes == [os.path.join(str(tmp_path), "Cached0_save.txt")]
+    assert character_manager.load_character("Cached0", str(tmp_path))['gold'] == 105
+
+    character_manager.add_gold(cache.get("Cached2"), 7)
+    assert cache.flush() == {"Cached2": True}
+    assert cache.flush() == {}
+    assert cache.stats()["writebacks"] == 2
+    assert character_manager.load_character("Cached2", str(tmp_path))['gold'] == 107
+
+def test_cache_lookup_survives_failed_writeback(tmp_path, monkeypatch):
+    """Test that a failing write-back keeps the dirty character and not the error"""
+    save_heroes(str(tmp_path), 4)
+    cache = character_manager.CharacterCache(str(tmp_path), max_characters=2)
+    character_manager.add_gold(cache.get("Cached0"), 5)
+    cache.get("Cached1")
+    original = character_manager.save_character
+
+    def failing(character, *args, **kwargs):
+        if character["name"] == "Cached0":
+            raise OSError("disk full")
+        return original(character, *args, **kwargs)
+
+    monkeypatch.setattr(character_manager, "save_character", failing)
+    assert cache.get("Cached2")["name"] == "Cached2"
+
+    assert "Cached0" in cache and "Cached1" not in cache and len(cache) == 2
+    assert cache.stats()["writeback_errors"] == 1
+    assert isinstance(cache.last_writeback_error, OSError)
+
+    monkeypatch.undo()
+    cache.get("Cached3")
+    assert "Cached0" not in cache and len(cache) == 2
+    assert character_manager.load_character("Cached0", str(tmp_path))['gold'] == 105
+
+def test_cache_byte_limit(tmp_path):
+    """Test that the estimated size bound evicts large characters"""
+    save_heroes(str(tmp_path), 4)
+    one = character_manager._estimate_character_size(
+        character_manager.load_character("Cached0", str(tmp_path)))
+    cache = character_manager.CharacterCache(str(tmp_path), max_characters=None, max_bytes=one * 2)
+
+    for i in range(4):
+        cache.get(f"Cached{i}")
+
+    assert len(cache) == 2
+    assert cache.total_bytes <= one * 2
+
+    big = character_manager.create_character("Big", "Mage")
+    for i in range(100):
+        big['completed_quests'].append(f"quest_{i}")
+    cache.put(big)
+    assert len(cache) == 1 and "Big" in cache
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])